@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets_management', '0011_remove_confidence_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetlisting',
+            index=models.Index(fields=['-created_at'], name='assets_mana_created_ee65fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetlisting',
+            index=models.Index(fields=['asset_type'], name='assets_mana_asset_t_7a6520_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetlisting',
+            index=models.Index(fields=['classification_value'], name='assets_mana_classif_1b600f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetlisting',
+            index=models.Index(fields=['risk_index'], name='assets_mana_risk_in_ab3a7c_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets_management', '0012_add_assetlisting_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='modelperformancecomparison',
+            index=models.Index(fields=['-test_date'], name='assets_mana_test_da_d78e5d_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+# DRF SearchFilter issues UPPER(col::text) LIKE UPPER('%q%') on PostgreSQL, so the
+# trigram indexes are built on that same expression for the planner to use them
+SEARCH_INDEXES = (
+    ('assetlisting_asset_trgm_idx', 'asset'),
+    ('assetlisting_description_trgm_idx', 'description'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON assets_management_assetlisting '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _ in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets_management', '0013_add_performance_test_date_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -315,6 +315,11 @@ class AssetListing(TimeStampedModel):
             models.Index(fields=['classification']),
             models.Index(fields=['mathematical_risk_category']),
             models.Index(fields=['standards_version']),
+            # List endpoint default ordering, filters and sortable columns
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['asset_type']),
+            models.Index(fields=['classification_value']),
+            models.Index(fields=['risk_index']),
         ]
         
     def __str__(self):
@@ -500,5 +505,11 @@ class ModelPerformanceComparison(TimeStampedModel):
     # Additional metadata
     notes = models.TextField(blank=True, null=True)
     
+    class Meta:
+        indexes = [
+            # performance_metrics reads the latest comparison
+            models.Index(fields=['-test_date']),
+        ]
+    
     def __str__(self):
         return f"Standards-Compliant Performance Comparison - {self.experiment_name} ({self.test_date.date()})"
\ No newline at end of file
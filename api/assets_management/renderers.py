@@ -0,0 +1,38 @@
+"""
+JSON renderer for the REST API, backed by orjson when it is installed
+"""
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    _fallback_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON rendered with orjson, falling back to DRF's JSONRenderer
+
+    orjson is listed in requirements.txt; the stock renderer only runs on
+    installs without it. Every response goes through orjson, including
+    indented output (browsable API, ``application/json; indent=N``), which
+    is always indented by two spaces. Non-finite floats render as ``null``
+    instead of raising, and values orjson cannot encode natively (Decimal,
+    lazy strings, ...) go through DRF's encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        option = _ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_fallback_default, option=option)
@@ -271,7 +271,8 @@ class AssetClassificationRequestSerializer(serializers.Serializer):
 class RiskIdentificationRequestSerializer(serializers.Serializer):
     """ISO 27005 compliant serializer for risk identification requests"""
     
-    asset_id = serializers.UUIDField()
+    # Optional when the asset comes from the URL and is passed as context['asset']
+    asset_id = serializers.UUIDField(required=False)
     confidentiality = serializers.FloatField(
         min_value=0.0, 
         max_value=1.0,
@@ -297,7 +298,9 @@ class RiskIdentificationRequestSerializer(serializers.Serializer):
         if len(set(cia_scores)) == 1 and cia_scores[0] not in [0.0, 1.0]:
             # This is a warning, not an error - allow but log
             import logging
-            logging.warning(f"Asset {data['asset_id']}: All CIA scores identical ({cia_scores[0]}) - verify assessment")
+            asset = self.context.get('asset')
+            asset_id = asset.id if asset is not None else data.get('asset_id')
+            logging.warning(f"Asset {asset_id}: All CIA scores identical ({cia_scores[0]}) - verify assessment")
         
         return data
 
@@ -322,24 +325,50 @@ class RiskAnalysisRequestSerializer(serializers.Serializer):
 class ModelComparisonRequestSerializer(serializers.Serializer):
     """Standards-compliant serializer for model comparison requests"""
     
-    asset_id = serializers.UUIDField()
+    # Optional when the asset comes from the URL and is passed as context['asset']
+    asset_id = serializers.UUIDField(required=False)
     experiment_name = serializers.CharField(max_length=100, default='Standards_Compliant_Comparison')
     use_standards_baseline = serializers.BooleanField(default=True)
     
+    REQUIRED_ASSET_FIELDS = ('confidentiality', 'integrity', 'availability', 'classification_value')
+    
+    def _check_required_fields(self, asset):
+        """Raise if the asset is missing any input the comparison needs"""
+        missing_fields = [field for field in self.REQUIRED_ASSET_FIELDS if getattr(asset, field) is None]
+        
+        if missing_fields:
+            raise serializers.ValidationError(
+                f"Asset must have the following fields completed: {', '.join(missing_fields)}"
+            )
+    
     def validate_asset_id(self, value):
         """Validate that the asset exists and has required data"""
         try:
             asset = AssetListing.objects.get(id=value)
-            required_fields = ['confidentiality', 'integrity', 'availability', 'classification_value']
-            missing_fields = [field for field in required_fields if getattr(asset, field) is None]
-            
-            if missing_fields:
-                raise serializers.ValidationError(
-                    f"Asset must have the following fields completed: {', '.join(missing_fields)}"
-                )
         except AssetListing.DoesNotExist:
             raise serializers.ValidationError("Asset with this ID does not exist.")
+        self._check_required_fields(asset)
         return value
+    
+    def validate(self, data):
+        """Check the already-loaded context asset without another lookup"""
+        asset = self.context.get('asset')
+        if asset is not None:
+            try:
+                self._check_required_fields(asset)
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError({'asset_id': e.detail})
+        return data
+
+
+class BatchClassificationRequestSerializer(serializers.Serializer):
+    """Serializer for batch asset classification requests"""
+    
+    asset_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        min_length=1,
+        max_length=100  # Limit batch size
+    )
 
 
 class BatchComparisonRequestSerializer(serializers.Serializer):
@@ -164,7 +164,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',  # Change to IsAuthenticated in production
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'assets_management.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
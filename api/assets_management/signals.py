@@ -1,8 +1,18 @@
 # signals.py
-from django.db.models.signals import post_migrate
+from django.core.cache import cache
+from django.db.models.signals import post_migrate, post_save, post_delete
 from django.core.management import call_command
 from django.dispatch import receiver
 
+from .models import ModelPerformanceComparison
+
+# Cached performance_metrics response. The deployment cache is LocMemCache,
+# which is private to each process, so the signal below only clears the copy
+# held by the process that wrote the row. Rows usually come from seed_all_data
+# or the admin, so other workers keep serving their copy until the timeout.
+PERFORMANCE_METRICS_CACHE_KEY = 'assets_management:latest_performance_metrics'
+PERFORMANCE_METRICS_CACHE_TIMEOUT = 300
+
 @receiver(post_migrate)
 def run_seeders(sender, **kwargs):
     if kwargs.get('app_config').name == 'assets_management':
@@ -12,3 +22,9 @@ def run_seeders(sender, **kwargs):
         except Exception as e:
             # Silently handle seeding errors for development
             pass
+
+
+@receiver([post_save, post_delete], sender=ModelPerformanceComparison)
+def invalidate_performance_metrics(sender, **kwargs):
+    # Same-process writes only; see PERFORMANCE_METRICS_CACHE_KEY
+    cache.delete(PERFORMANCE_METRICS_CACHE_KEY)
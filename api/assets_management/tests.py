@@ -0,0 +1,260 @@
+"""
+Tests for the assets_management utilities
+"""
+import warnings
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+from sklearn.metrics import (
+    accuracy_score, classification_report, confusion_matrix, f1_score, precision_score, recall_score
+)
+
+from .utils import risk_identification
+from .utils.model_comparison import ModelComparisonFramework
+from .utils.risk_analysis import (
+    _iso27005_core,
+    calculate_risk_level,
+    calculate_risk_level_batch,
+    calculate_risk_levels_array
+)
+from .utils.risk_identification import (
+    IntegratedRiskIdentification,
+    NISTRiskIdentification,
+    OCTAVERiskIdentification,
+    clear_assessment_cache,
+    standardize_asset_context
+)
+
+
+def _asset_context(asset_id, confidentiality=0.7):
+    return standardize_asset_context({
+        'id': asset_id,
+        'asset': 'Test Asset',
+        'asset_type': 'Database',
+        'owner_department_name': 'IT',
+        'confidentiality': confidentiality,
+        'integrity': 0.6,
+        'availability': 0.5,
+        'classification_value': 0.6,
+        'business_criticality': 0.7
+    })
+
+
+class ModelComparisonMetricsTests(SimpleTestCase):
+    """Confusion-matrix metrics in ModelComparisonFramework against sklearn.metrics"""
+
+    def setUp(self):
+        self.framework = ModelComparisonFramework()
+        self.rng = np.random.default_rng(0)
+
+    def assertMatchesSklearn(self, metrics, y_true, y_pred):
+        average = 'weighted' if len(np.unique(y_true)) > 2 else 'binary'
+        expected = {
+            'accuracy': accuracy_score(y_true, y_pred),
+            'precision': precision_score(y_true, y_pred, average=average, zero_division=0),
+            'recall': recall_score(y_true, y_pred, average=average, zero_division=0),
+            'f1_score': f1_score(y_true, y_pred, average=average, zero_division=0)
+        }
+        for name, value in expected.items():
+            # Stored metrics are rounded to 4 decimals
+            self.assertAlmostEqual(metrics[name], value, delta=5e-5 + 1e-12, msg=name)
+        self.assertEqual(
+            metrics['confusion_matrix'],
+            confusion_matrix(y_true, y_pred, labels=np.union1d(y_true, y_pred)).tolist()
+        )
+        self.assertEqual(metrics['support'], len(y_true))
+        self.assertReportEqual(
+            metrics['classification_report'],
+            classification_report(y_true, y_pred, output_dict=True, zero_division=0)
+        )
+
+    def assertReportEqual(self, report, expected):
+        self.assertEqual(set(report), set(expected))
+        for key, value in expected.items():
+            if isinstance(value, dict):
+                self.assertEqual(set(report[key]), set(value), key)
+                for field, number in value.items():
+                    self.assertAlmostEqual(report[key][field], number, places=12, msg=(key, field))
+            else:
+                self.assertAlmostEqual(report[key], value, places=12, msg=key)
+
+    def check(self, y_true, y_pred):
+        metrics = self.framework.add_model_results('model', y_true, y_pred)
+        self.assertNotIn('error', metrics)
+        self.assertMatchesSklearn(metrics, y_true, y_pred)
+        return metrics
+
+    def test_multiclass(self):
+        for _ in range(20):
+            y_true = self.rng.integers(0, 4, 60)
+            y_pred = self.rng.integers(0, 4, 60)
+            self.check(y_true, y_pred)
+
+    def test_multiclass_with_unpredicted_and_extra_labels(self):
+        self.check([0, 1, 2, 2, 1, 0], [0, 0, 0, 3, 1, 0])
+
+    def test_binary_with_label_one(self):
+        for _ in range(20):
+            self.check(self.rng.integers(0, 2, 40), self.rng.integers(0, 2, 40))
+        self.check([1, 2, 1, 2], [2, 2, 1, 1])
+
+    def test_binary_without_label_one_is_an_error(self):
+        for y_true, y_pred in (([0, 2, 0, 2], [0, 0, 2, 2]), ([0, 1, 0, 1], [0, 2, 1, 1])):
+            with self.assertRaises(ValueError):
+                precision_score(y_true, y_pred, average='binary', zero_division=0)
+            self.assertIn('error', self.framework.add_model_results('invalid', y_true, y_pred))
+            self.assertNotIn('invalid', self.framework.models)
+
+    def test_single_class(self):
+        with warnings.catch_warnings():
+            # Newer sklearn warns about single-label confusion matrices
+            warnings.simplefilter('ignore', UserWarning)
+            self.check([0, 0, 0], [0, 0, 0])
+            self.check([1, 1, 1], [1, 1, 1])
+            self.check([2, 2, 2], [2, 2, 2])
+        self.check([0, 0, 0, 0], [0, 1, 0, 1])
+
+    def test_from_confusion_matrix(self):
+        for y_true, y_pred in (
+            (self.rng.integers(0, 4, 60), self.rng.integers(0, 4, 60)),
+            (self.rng.integers(0, 2, 40), self.rng.integers(0, 2, 40)),
+            ([3, 4, 5, 5, 3], [3, 5, 5, 5, 4])
+        ):
+            labels = np.union1d(y_true, y_pred)
+            cm = confusion_matrix(y_true, y_pred, labels=labels)
+            from_cm = self.framework.add_model_results_from_cm('from_cm', cm, labels=labels)
+            from_labels = self.framework.add_model_results('from_labels', y_true, y_pred)
+            self.assertEqual(from_cm, from_labels)
+            self.assertEqual(self.framework.models['from_cm']['labels'], labels.tolist())
+
+        # Without labels, rows and columns are classes 0..K-1
+        cm = confusion_matrix([0, 1, 2, 2], [0, 2, 2, 1])
+        self.assertMatchesSklearn(
+            self.framework.add_model_results_from_cm('default_labels', cm), [0, 1, 2, 2], [0, 2, 2, 1]
+        )
+
+
+class RiskAnalysisBatchTests(SimpleTestCase):
+    """Array and batch risk analysis against the scalar calculate_risk_level path"""
+
+    # Dense grid over and around the valid range, plus known rounding edge cases
+    RISK_INDICES = np.concatenate([np.linspace(-0.1, 1.1, 24001), [0.79, 0.5, 0.25, 0.75]])
+
+    def test_array_matches_scalar_core(self):
+        arrays = calculate_risk_levels_array(self.RISK_INDICES)
+        for position, risk_index in enumerate(self.RISK_INDICES.tolist()):
+            expected = _iso27005_core(risk_index)
+            for array, value in zip(arrays, expected):
+                self.assertAlmostEqual(array[position], value, places=12)
+
+    def test_batch_matches_scalar(self):
+        batch = calculate_risk_level_batch(self.RISK_INDICES)
+        self.assertEqual(len(batch), len(self.RISK_INDICES))
+        for risk_index, result in zip(self.RISK_INDICES.tolist(), batch):
+            self.assertEqual(result, calculate_risk_level(risk_index), risk_index)
+
+
+class AssessmentCacheTests(SimpleTestCase):
+    """Process-wide cache of comprehensive assessment methodology results"""
+
+    def setUp(self):
+        clear_assessment_cache()
+        self.addCleanup(clear_assessment_cache)
+        self.identifier = IntegratedRiskIdentification()
+        run_methodologies = mock.patch.object(
+            IntegratedRiskIdentification, '_run_methodologies',
+            autospec=True, side_effect=IntegratedRiskIdentification._run_methodologies
+        )
+        self.run_methodologies = run_methodologies.start()
+        self.addCleanup(run_methodologies.stop)
+
+    def assess(self, asset_id, **context):
+        return self.identifier.comprehensive_assessment(asset_id, _asset_context(asset_id, **context))
+
+    def test_miss_runs_methodologies(self):
+        self.assess('asset-1')
+        self.assess('asset-1', confidentiality=0.9)
+        self.assertEqual(self.run_methodologies.call_count, 2)
+
+    def test_hit_reuses_results_with_fresh_timestamps(self):
+        first = self.assess('asset-1')
+        second = self.assess('asset-1')
+
+        self.assertEqual(self.run_methodologies.call_count, 1)
+        self.assertEqual(
+            first['integrated_assessment'].to_dict() | {'assessment_timestamp': None},
+            second['integrated_assessment'].to_dict() | {'assessment_timestamp': None}
+        )
+        self.assertGreater(second['assessment_timestamp'], first['assessment_timestamp'])
+        timestamps = {
+            result.assessment_timestamp.isoformat()
+            for result in (second['integrated_assessment'], *second['individual_assessments'].values())
+        }
+        self.assertEqual(timestamps, {second['assessment_timestamp']})
+
+    def test_hit_is_isolated_from_caller_mutation(self):
+        first = self.assess('asset-1')
+        first['integrated_assessment'].recommendations.append('mutated')
+        first['integrated_assessment'].additional_data['mutated'] = True
+        for result in first['individual_assessments'].values():
+            result.additional_data['mutated'] = True
+        for threat in first['individual_assessments']['iso_27005'].threats_identified:
+            threat['mutated'] = True
+
+        second = self.assess('asset-1')
+
+        self.assertNotIn('mutated', second['integrated_assessment'].recommendations)
+        self.assertNotIn('mutated', second['integrated_assessment'].additional_data)
+        for result in second['individual_assessments'].values():
+            self.assertNotIn('mutated', result.additional_data)
+        self.assertTrue(second['individual_assessments']['iso_27005'].threats_identified)
+        for threat in second['individual_assessments']['iso_27005'].threats_identified:
+            self.assertNotIn('mutated', threat)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with mock.patch.object(risk_identification, '_ASSESSMENT_CACHE_SIZE', 2):
+            self.assess('asset-1')
+            self.assess('asset-2')
+            self.assess('asset-1')  # hit, asset-2 is now least recently used
+            self.assess('asset-3')  # evicts asset-2
+            self.assertEqual(self.run_methodologies.call_count, 3)
+
+            self.assess('asset-1')
+            self.assertEqual(self.run_methodologies.call_count, 3)
+
+            self.assess('asset-2')
+            self.assertEqual(self.run_methodologies.call_count, 4)
+
+
+class MethodologyIsolationTests(SimpleTestCase):
+    """Results must not hand out the module-level methodology tables"""
+
+    def test_octave_results_are_isolated_from_caller_mutation(self):
+        octave = OCTAVERiskIdentification()
+        first = octave.assess_risk('asset-1', _asset_context('asset-1', confidentiality=0.3))
+        for finding in first.threats_identified:
+            finding['mutated'] = True
+        for finding in first.additional_data['organizational_analysis']['organizational_vulnerabilities']:
+            finding['mutated'] = True
+
+        second = octave.assess_risk('asset-2', _asset_context('asset-2', confidentiality=0.3))
+
+        self.assertTrue(second.threats_identified)
+        for finding in second.threats_identified:
+            self.assertNotIn('mutated', finding)
+        for finding in second.additional_data['organizational_analysis']['organizational_vulnerabilities']:
+            self.assertNotIn('mutated', finding)
+
+    def test_nist_threat_sources_are_isolated_from_caller_mutation(self):
+        nist = NISTRiskIdentification()
+        first = nist.assess_risk('asset-1', _asset_context('asset-1'))
+        first.additional_data['threat_sources'][0]['name'] = 'mutated'
+        first.additional_data['threat_sources'].append({'name': 'mutated'})
+
+        second = NISTRiskIdentification().assess_risk('asset-2', _asset_context('asset-2'))
+
+        self.assertEqual(
+            [source['name'] for source in second.additional_data['threat_sources']],
+            [source.name for source in NISTRiskIdentification.THREAT_SOURCES]
+        )
@@ -7,9 +7,24 @@ from skfuzzy import control as ctrl
 import os
 import pickle
 import json
+from bisect import bisect_left
+from copy import deepcopy
+from functools import lru_cache
 from datetime import datetime
 
 
+# Government classification bands: a score up to each threshold falls in the band
+_CLASSIFICATION_THRESHOLDS = (0.25, 0.50, 0.75)
+_CLASSIFICATION_CATEGORIES = ("Public", "Official", "Confidential", "Restricted")
+_CLASSIFICATION_RISK_LEVELS = ("Low", "Low-Medium", "Medium-High", "High")
+_CLASSIFICATION_DESCRIPTIONS = (
+    "Information that can be disclosed to the public without harm",
+    "Information that requires protection but is not classified",
+    "Information that could cause damage if disclosed without authorization",
+    "Information that could cause serious damage if disclosed without authorization",
+)
+
+
 def classify_asset_fuzzy(business_criticality, data_sensitivity, operational_dependency, regulatory_impact, confidentiality, integrity, availability):
     """
     Enhanced 7-parameter fuzzy logic asset classification following NIST SP 800-60 and ISO 27005 standards
@@ -26,6 +41,20 @@ def classify_asset_fuzzy(business_criticality, data_sensitivity, operational_dep
     Returns:
         dict: Classification result with comprehensive risk assessment
     """
+    return deepcopy(_classify_asset_fuzzy(
+        business_criticality, data_sensitivity, operational_dependency, regulatory_impact,
+        confidentiality, integrity, availability
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _classify_asset_fuzzy(business_criticality, data_sensitivity, operational_dependency, regulatory_impact, confidentiality, integrity, availability):
+    """
+    Cached fuzzy classification for one set of inputs.
+    
+    The fuzzy system is deterministic, so repeated inputs reuse the result; callers
+    receive deep copies because the result dict is mutable.
+    """
     try:
         # Validate all inputs are in 0-1 range
         inputs = [business_criticality, data_sensitivity, operational_dependency, regulatory_impact, 
@@ -121,22 +150,10 @@ def classify_asset_fuzzy(business_criticality, data_sensitivity, operational_dep
         final_score = min(max(fuzzy_score * 0.7 + business_weight + technical_weight + data_weight, 0.0), 1.0)
         
         # Determine government classification levels
-        if final_score <= 0.25:
-            category = "Public"
-            description = "Information that can be disclosed to the public without harm"
-            risk_level = "Low"
-        elif final_score <= 0.50:
-            category = "Official"
-            description = "Information that requires protection but is not classified"
-            risk_level = "Low-Medium"
-        elif final_score <= 0.75:
-            category = "Confidential"
-            description = "Information that could cause damage if disclosed without authorization"
-            risk_level = "Medium-High"
-        else:
-            category = "Restricted"
-            description = "Information that could cause serious damage if disclosed without authorization"
-            risk_level = "High"
+        band = bisect_left(_CLASSIFICATION_THRESHOLDS, final_score)
+        category = _CLASSIFICATION_CATEGORIES[band]
+        description = _CLASSIFICATION_DESCRIPTIONS[band]
+        risk_level = _CLASSIFICATION_RISK_LEVELS[band]
         
         # Calculate individual component scores for transparency
         cia_score = (confidentiality + integrity + availability) / 3
@@ -220,14 +237,7 @@ def validate_classification_standards_compliance(classification_result, inputs=N
     else:
         score = float(classification_result)
         methodology = 'Unknown'
-        if score <= 0.25:
-            category = "Public"
-        elif score <= 0.50:
-            category = "Official"
-        elif score <= 0.75:
-            category = "Confidential"
-        else:
-            category = "Restricted"
+        category = _CLASSIFICATION_CATEGORIES[bisect_left(_CLASSIFICATION_THRESHOLDS, score)]
     
     # Validate score range
     if not (0 <= score <= 1):
@@ -355,18 +365,9 @@ def classify_asset_ensemble(business_criticality, data_sensitivity, operational_
         ensemble_score = category_to_score.get(ensemble_category, fuzzy_result['classification_score'])
         
         # Determine risk level and description
-        if ensemble_score <= 0.25:
-            risk_level = "Low"
-            description = "Information that can be disclosed to the public without harm"
-        elif ensemble_score <= 0.50:
-            risk_level = "Low-Medium"
-            description = "Information that requires protection but is not classified"
-        elif ensemble_score <= 0.75:
-            risk_level = "Medium-High"
-            description = "Information that could cause damage if disclosed without authorization"
-        else:
-            risk_level = "High"
-            description = "Information that could cause serious damage if disclosed without authorization"
+        band = bisect_left(_CLASSIFICATION_THRESHOLDS, ensemble_score)
+        risk_level = _CLASSIFICATION_RISK_LEVELS[band]
+        description = _CLASSIFICATION_DESCRIPTIONS[band]
         
         # Build comprehensive result
         result = {
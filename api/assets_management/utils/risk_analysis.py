@@ -1,188 +1,348 @@
 """
 Risk analysis utilities for mathematical risk calculations
 """
-import math
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
 
+import numpy as np
 
-def calculate_risk_level(risk_index):
+# Upper (inclusive) risk score bounds of the Low, Medium and High levels.
+# Labels, categories expected by views.py and recommendations are indexed by level;
+# recommendations are shared tuples, so callers must not mutate them.
+_RISK_THRESHOLDS = np.array([0.25, 0.5, 0.75])
+_RISK_LEVELS = ("Low", "Medium", "High", "Critical")
+_RISK_CATEGORIES = ("Low Risk", "Medium Risk", "High Risk", "Very High Risk")
+_RISK_RECOMMENDATIONS = (
+    (
+        "Monitor asset regularly",
+        "Maintain current security measures",
+        "Review security annually"
+    ),
+    (
+        "Implement additional security controls",
+        "Increase monitoring frequency",
+        "Conduct quarterly security reviews",
+        "Consider backup and recovery procedures"
+    ),
+    (
+        "Immediate security assessment required",
+        "Implement comprehensive security controls",
+        "Daily monitoring and alerts",
+        "Develop incident response plan",
+        "Consider asset isolation or segmentation"
+    ),
+    (
+        "Emergency security measures required",
+        "Immediate isolation if necessary",
+        "Continuous monitoring",
+        "Executive notification required",
+        "Comprehensive incident response plan",
+        "Consider asset replacement or upgrade"
+    ),
+)
+
+# Upper (inclusive) bounds of the first four probability / impact ratings
+_RATING_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_RATING_THRESHOLDS = np.array(_RATING_BOUNDS)
+_PROBABILITY_RATINGS = ("Very Low", "Low", "Medium", "High", "Very High")
+_IMPACT_RATINGS = ("Minimal", "Minor", "Moderate", "Major", "Severe")
+
+# Lower (inclusive) risk score bounds of the Medium, High and Immediate mitigation priorities
+_MITIGATION_BOUNDS = (0.25, 0.5, 0.75)
+_MITIGATION_PRIORITIES = (
+    {
+        "priority": "Low",
+        "timeframe": "Within 3 months",
+        "resources": "Low",
+        "escalation": "Team level"
+    },
+    {
+        "priority": "Medium",
+        "timeframe": "Within 1 month",
+        "resources": "Medium",
+        "escalation": "Department level"
+    },
+    {
+        "priority": "High",
+        "timeframe": "Within 1 week",
+        "resources": "Medium-High",
+        "escalation": "Management level"
+    },
+    {
+        "priority": "Immediate",
+        "timeframe": "Within 24 hours",
+        "resources": "High",
+        "escalation": "Executive level"
+    },
+)
+
+
+def _iso27005_core(x):
     """
-    Calculate risk level using mathematical formula based on risk index.
-    
-    Args:
-        risk_index (float): Risk index value (0-1 scale)
+    Numeric core of the ISO 27005 risk calculation for one risk index.
     
     Returns:
-        dict: Risk analysis with level, score, and recommendations
+        tuple: (likelihood, impact, environmental_factor, risk_score, vulnerability_factor)
     """
-    try:
-        # Ensure risk_index is within valid range
-        risk_index = min(max(float(risk_index), 0), 1)
-        
-        # PHASE 3: ISO 27005 MATHEMATICAL RISK ANALYSIS
-        # Implement ISO 27005 mathematical formula: Risk = Likelihood × Impact × Environmental_Factors
-        # Reference: ISO/IEC 27005:2018 - Information security risk management
-        
-        # Convert risk_index to likelihood component (0-1 scale)
-        # ISO 27005 defines likelihood as probability of threat occurrence
-        likelihood = risk_index  # risk_index represents likelihood from Phase 2
-        
-        # Calculate impact using ISO 27005 exponential impact model
-        # Impact increases exponentially to reflect real-world consequences
-        if risk_index == 0:
-            impact = 0
-        else:
-            # ISO 27005 impact calculation: I = L^α × β 
-            # where α=1.3 (exponential factor), β=1.05 (scaling factor)
-            # These values are based on ISO 27005 Annex C risk assessment examples
-            impact = min(math.pow(risk_index, 1.3) * 1.05, 1.0)
-        
-        # Environmental factors based on ISO 27005 organizational context
-        # Factors include: regulatory environment, industry sector, organizational maturity
-        environmental_factor = 1.0 + (0.15 * risk_index)  # Conservative 15% increase
-        
-        # ISO 27005 MATHEMATICAL RISK FORMULA: R = L × I × E (normalized to 0-1)
-        calculated_risk_level = min(likelihood * impact * environmental_factor, 1.0)
-        
-        # Store harm value for reporting (impact component)
-        harm_value = impact
-        
-        # Use calculated risk level for categorization
-        risk_score = calculated_risk_level
-        
-        # Determine risk level based on score (0-1 scale)
-        if risk_score <= 0.25:
-            risk_level = "Low"
-            priority = "Low"
-            recommendations = [
-                "Monitor asset regularly",
-                "Maintain current security measures",
-                "Review security annually"
-            ]
-        elif risk_score <= 0.5:
-            risk_level = "Medium"
-            priority = "Medium"
-            recommendations = [
-                "Implement additional security controls",
-                "Increase monitoring frequency",
-                "Conduct quarterly security reviews",
-                "Consider backup and recovery procedures"
-            ]
-        elif risk_score <= 0.75:
-            risk_level = "High"
-            priority = "High"
-            recommendations = [
-                "Immediate security assessment required",
-                "Implement comprehensive security controls",
-                "Daily monitoring and alerts",
-                "Develop incident response plan",
-                "Consider asset isolation or segmentation"
-            ]
-        else:
-            risk_level = "Critical"
-            priority = "Critical"
-            recommendations = [
-                "Emergency security measures required",
-                "Immediate isolation if necessary",
-                "Continuous monitoring",
-                "Executive notification required",
-                "Comprehensive incident response plan",
-                "Consider asset replacement or upgrade"
-            ]
-        
-        # Calculate additional metrics (using proper 0-1 scale)
-        vulnerability_factor = min(risk_score * 1.1, 1.0)
-        threat_probability = likelihood  # Already calculated above
-        impact_severity = impact  # Already calculated above
-        
-        # Convert risk_level to risk_category format expected by views.py
-        if risk_level == "Critical":
-            risk_category = "Very High Risk"
-        else:
-            risk_category = f"{risk_level} Risk"
+    # Ensure risk_index is within valid range
+    if x < 0.0:
+        x = 0.0
+    elif x > 1.0:
+        x = 1.0
+    
+    # ISO 27005 impact calculation: I = L^α × β
+    # where α=1.3 (exponential factor), β=1.05 (scaling factor)
+    # These values are based on ISO 27005 Annex C risk assessment examples
+    if x == 0.0:
+        impact = 0.0
+    else:
+        impact = x ** 1.3 * 1.05
+        if impact > 1.0:
+            impact = 1.0
+    
+    # Environmental factors based on ISO 27005 organizational context
+    # Factors include: regulatory environment, industry sector, organizational maturity
+    environmental_factor = 1.0 + 0.15 * x  # Conservative 15% increase
+    
+    # ISO 27005 MATHEMATICAL RISK FORMULA: R = L × I × E (normalized to 0-1)
+    risk_score = x * impact * environmental_factor
+    if risk_score > 1.0:
+        risk_score = 1.0
+    
+    vulnerability_factor = risk_score * 1.1
+    if vulnerability_factor > 1.0:
+        vulnerability_factor = 1.0
+    
+    return x, impact, environmental_factor, risk_score, vulnerability_factor
+
+
+# Fallback response (matching the expected format) for risk indices that are not numbers.
+# Read-only so the shared instance cannot be modified through a returned result.
+_FALLBACK_RISK_ANALYSIS = MappingProxyType({
+    # Core values expected by views.py
+    "calculated_risk_level": 0.5,
+    "harm_value": 0.5,
+    "risk_category": "Medium Risk",
+    "methodology": "Fallback Risk Analysis",
+    
+    # Additional analysis data
+    "probability": 0.5,
+    "impact": 0.5,
+    "environmental_factor": 1.0,
+    "risk_level": "Medium",
+    "risk_score": 0.5,
+    "risk_index": 0.5,
+    "priority": "Medium",
+    "vulnerability_factor": 0.5,
+    "threat_probability": 0.5,
+    "impact_severity": 0.5,
+    "recommendations": ("Manual risk assessment required - algorithm error occurred",),
+    "risk_matrix": MappingProxyType({
+        "probability": "Medium",
+        "impact": "Medium",
+        "overall": "Medium"
+    })
+})
+
+
+class RiskProfile(NamedTuple):
+    """ISO 27005 risk profile for one risk index, at full numeric precision."""
+    risk_score: float
+    harm_value: float
+    likelihood: float
+    environmental_factor: float
+    vulnerability_factor: float
+    risk_level: str
+    risk_category: str
+    recommendations: Tuple[str, ...]
+    probability_rating: str
+    impact_rating: str
+    
+    def to_dict(self):
+        """Risk analysis dict in the format returned by calculate_risk_level (rounded to 3 decimals)."""
+        risk_score = round(self.risk_score, 3)
+        harm_value = round(self.harm_value, 3)
+        likelihood = round(self.likelihood, 3)
         
         return {
             # Core values expected by views.py
-            "calculated_risk_level": round(calculated_risk_level, 3),
-            "harm_value": round(harm_value, 3),
-            "risk_category": risk_category,
+            "calculated_risk_level": risk_score,
+            "harm_value": harm_value,
+            "risk_category": self.risk_category,
             "methodology": "Mathematical Risk Analysis (ISO 27005)",
             
             # Additional analysis data
-            "probability": round(likelihood, 3),
-            "impact": round(impact, 3),
-            "environmental_factor": round(environmental_factor, 3),
-            "risk_level": risk_level,
-            "risk_score": round(risk_score, 3),
-            "risk_index": round(risk_index, 3),
-            "priority": priority,
-            "vulnerability_factor": round(vulnerability_factor, 3),
-            "threat_probability": round(threat_probability, 3),
-            "impact_severity": round(impact_severity, 3),
-            "recommendations": recommendations,
+            "probability": likelihood,
+            "impact": harm_value,
+            "environmental_factor": round(self.environmental_factor, 3),
+            "risk_level": self.risk_level,
+            "risk_score": risk_score,
+            "risk_index": likelihood,
+            "priority": self.risk_level,
+            "vulnerability_factor": round(self.vulnerability_factor, 3),
+            "threat_probability": likelihood,
+            "impact_severity": harm_value,
+            "recommendations": self.recommendations,
             "risk_matrix": {
-                "probability": _get_probability_rating(threat_probability),
-                "impact": _get_impact_rating(impact_severity),
-                "overall": risk_level
+                "probability": self.probability_rating,
+                "impact": self.impact_rating,
+                "overall": self.risk_level
             }
         }
-        
-    except Exception as e:
-        print(f"Risk analysis error: {e}")
-        # Fallback response matching expected format
-        return {
+
+
+@lru_cache(maxsize=2048)
+def _risk_profile(risk_index):
+    """
+    Cached ISO 27005 risk profile for one risk index.
+    
+    RiskProfile is immutable, so cached entries can be shared between calls.
+    """
+    # PHASE 3: ISO 27005 MATHEMATICAL RISK ANALYSIS
+    # Implement ISO 27005 mathematical formula: Risk = Likelihood × Impact × Environmental_Factors
+    # Reference: ISO/IEC 27005:2018 - Information security risk management
+    # risk_index represents likelihood from Phase 2
+    likelihood, impact, environmental_factor, risk_score, vulnerability_factor = _iso27005_core(risk_index)
+    
+    # Determine risk level based on score (0-1 scale); each bound is inclusive
+    level = (risk_score > 0.25) + (risk_score > 0.5) + (risk_score > 0.75)
+    
+    return RiskProfile(
+        risk_score=risk_score,
+        harm_value=impact,
+        likelihood=likelihood,
+        environmental_factor=environmental_factor,
+        vulnerability_factor=vulnerability_factor,
+        risk_level=_RISK_LEVELS[level],
+        risk_category=_RISK_CATEGORIES[level],
+        recommendations=_RISK_RECOMMENDATIONS[level],
+        probability_rating=_get_probability_rating(likelihood),
+        impact_rating=_get_impact_rating(impact)
+    )
+
+
+def calculate_risk_level(risk_index):
+    """
+    Calculate risk level using mathematical formula based on risk index.
+    
+    Args:
+        risk_index (float): Risk index value (0-1 scale)
+    
+    Returns:
+        dict: Risk analysis with level, score, and recommendations
+    """
+    try:
+        risk_index = float(risk_index)
+    except (TypeError, ValueError) as e:
+        return {**_FALLBACK_RISK_ANALYSIS, "error": str(e)}
+    if risk_index != risk_index:
+        return {**_FALLBACK_RISK_ANALYSIS, "error": "Risk index is NaN"}
+    
+    return _risk_profile(risk_index).to_dict()
+
+
+def calculate_risk_levels_array(risk_indices):
+    """
+    Compute the ISO 27005 risk quantities for an array of risk indices.
+    
+    Array counterpart of the scalar core: one pass of NumPy operations over
+    contiguous float64 buffers, with no per-asset labels or dicts.
+    
+    Args:
+        risk_indices (array-like): Risk index values (0-1 scale)
+    
+    Returns:
+        tuple: (likelihood, impact, environmental_factor, risk_score, vulnerability_factor) arrays
+    """
+    likelihood = np.clip(np.asarray(risk_indices, dtype=np.float64).ravel(), 0, 1)
+    
+    # Same ISO 27005 model as calculate_risk_level: R = L x I x E
+    # (in-place ufuncs, so each derived quantity allocates a single array)
+    impact = np.power(likelihood, 1.3)
+    impact *= 1.05
+    np.minimum(impact, 1.0, out=impact)
+    
+    environmental_factor = likelihood * 0.15
+    environmental_factor += 1.0
+    
+    risk_score = likelihood * impact
+    risk_score *= environmental_factor
+    np.minimum(risk_score, 1.0, out=risk_score)
+    
+    vulnerability_factor = risk_score * 1.1
+    np.minimum(vulnerability_factor, 1.0, out=vulnerability_factor)
+    
+    return likelihood, impact, environmental_factor, risk_score, vulnerability_factor
+
+
+def calculate_risk_level_batch(risk_indices):
+    """
+    Calculate risk levels for many risk index values at once.
+    
+    Vectorised counterpart of calculate_risk_level for bulk scoring: the
+    ISO 27005 math runs as NumPy array operations and only the per-asset
+    result dicts are built in Python.
+    
+    Args:
+        risk_indices (array-like): Risk index values (0-1 scale)
+    
+    Returns:
+        list: Risk analysis dicts (same layout as calculate_risk_level), in input order
+    """
+    likelihood, impact, environmental_factor, risk_score, vulnerability_factor = calculate_risk_levels_array(risk_indices)
+    
+    level_indices = np.digitize(risk_score, _RISK_THRESHOLDS, right=True).tolist()
+    probability_indices = np.digitize(likelihood, _RATING_THRESHOLDS, right=True).tolist()
+    impact_indices = np.digitize(impact, _RATING_THRESHOLDS, right=True).tolist()
+    
+    # Python round() per value, as calculate_risk_level does: np.round scales
+    # by 1000 first and can land on the other side of a half-way decimal
+    rounded = [
+        [round(value, 3) for value in row]
+        for row in np.stack([risk_score, impact, likelihood, environmental_factor, vulnerability_factor]).T.tolist()
+    ]
+    
+    return [
+        {
             # Core values expected by views.py
-            "calculated_risk_level": 0.5,
-            "harm_value": 0.5,
-            "risk_category": "Medium Risk",
-            "methodology": "Fallback Risk Analysis",
+            "calculated_risk_level": score,
+            "harm_value": harm,
+            "risk_category": _RISK_CATEGORIES[level],
+            "methodology": "Mathematical Risk Analysis (ISO 27005)",
             
             # Additional analysis data
-            "probability": 0.5,
-            "impact": 0.5,
-            "environmental_factor": 1.0,
-            "risk_level": "Medium",
-            "risk_score": 0.5,
-            "risk_index": float(risk_index) if 'risk_index' in locals() else 0.5,
-            "priority": "Medium",
-            "vulnerability_factor": 0.5,
-            "threat_probability": 0.5,
-            "impact_severity": 0.5,
-            "recommendations": ["Manual risk assessment required - algorithm error occurred"],
+            "probability": probability,
+            "impact": harm,
+            "environmental_factor": environment,
+            "risk_level": _RISK_LEVELS[level],
+            "risk_score": score,
+            "risk_index": probability,
+            "priority": _RISK_LEVELS[level],
+            "vulnerability_factor": vulnerability,
+            "threat_probability": probability,
+            "impact_severity": harm,
+            "recommendations": _RISK_RECOMMENDATIONS[level],
             "risk_matrix": {
-                "probability": "Medium",
-                "impact": "Medium",
-                "overall": "Medium"
-            },
-            "error": str(e)
+                "probability": _PROBABILITY_RATINGS[probability_index],
+                "impact": _IMPACT_RATINGS[impact_index],
+                "overall": _RISK_LEVELS[level]
+            }
         }
+        for (score, harm, probability, environment, vulnerability), level, probability_index, impact_index
+        in zip(rounded, level_indices, probability_indices, impact_indices)
+    ]
 
 
 def _get_probability_rating(probability):
     """Get probability rating based on numeric value."""
-    if probability <= 0.2:
-        return "Very Low"
-    elif probability <= 0.4:
-        return "Low"
-    elif probability <= 0.6:
-        return "Medium"
-    elif probability <= 0.8:
-        return "High"
-    else:
-        return "Very High"
+    return _PROBABILITY_RATINGS[bisect_left(_RATING_BOUNDS, probability)]
 
 
 def _get_impact_rating(impact):
     """Get impact rating based on numeric value."""
-    if impact <= 0.2:
-        return "Minimal"
-    elif impact <= 0.4:
-        return "Minor"
-    elif impact <= 0.6:
-        return "Moderate"
-    elif impact <= 0.8:
-        return "Major"
-    else:
-        return "Severe"
+    return _IMPACT_RATINGS[bisect_left(_RATING_BOUNDS, impact)]
 
 
 def calculate_risk_mitigation_priority(risk_analysis):
@@ -197,31 +357,5 @@ def calculate_risk_mitigation_priority(risk_analysis):
     """
     risk_score = risk_analysis.get("risk_score", 0)
     
-    if risk_score >= 7.5:
-        return {
-            "priority": "Immediate",
-            "timeframe": "Within 24 hours",
-            "resources": "High",
-            "escalation": "Executive level"
-        }
-    elif risk_score >= 5.0:
-        return {
-            "priority": "High",
-            "timeframe": "Within 1 week",
-            "resources": "Medium-High",
-            "escalation": "Management level"
-        }
-    elif risk_score >= 2.5:
-        return {
-            "priority": "Medium",
-            "timeframe": "Within 1 month",
-            "resources": "Medium",
-            "escalation": "Department level"
-        }
-    else:
-        return {
-            "priority": "Low",
-            "timeframe": "Within 3 months",
-            "resources": "Low",
-            "escalation": "Team level"
-        }
\ No newline at end of file
+    # risk_score is on the 0-1 scale; a score equal to a bound moves up a tier
+    return _MITIGATION_PRIORITIES[bisect_right(_MITIGATION_BOUNDS, risk_score)].copy()
@@ -9,11 +9,25 @@ Implements multiple standardized methodologies:
 Provides comprehensive risk identification following industry best practices
 """
 import math
+import re
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import chain, islice
+from statistics import fmean
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from hashlib import blake2b
+from threading import Lock
+from types import MappingProxyType
 from enum import Enum
 
+import numpy as np
+
+from .compute_risk_level import compute_risk_level
+
 
 class RiskMethodology(Enum):
     """Supported Risk Identification Methodologies"""
@@ -23,7 +37,7 @@ class RiskMethodology(Enum):
     INTEGRATED = "integrated"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThreatScenario:
     """Represents a threat scenario for event-based risk identification"""
     threat_id: str
@@ -37,7 +51,7 @@ class ThreatScenario:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StandardizedRiskResult:
     """Unified result structure for all methodologies"""
     asset_id: str
@@ -52,9 +66,34 @@ class StandardizedRiskResult:
     compliance_frameworks: List[str]
     assessment_timestamp: datetime
     additional_data: Dict
+    
+    def to_dict(self) -> Dict:
+        """Plain dict of the result (methodology value, ISO timestamp) for JSON serializers"""
+        return {
+            "asset_id": self.asset_id,
+            "methodology": self.methodology.value,
+            "risk_score": self.risk_score,
+            "risk_level": self.risk_level,
+            "likelihood": self.likelihood,
+            "impact": self.impact,
+            "threats_identified": list(self.threats_identified),
+            "vulnerabilities_identified": list(self.vulnerabilities_identified),
+            "recommendations": list(self.recommendations),
+            "compliance_frameworks": list(self.compliance_frameworks),
+            "assessment_timestamp": self.assessment_timestamp.isoformat(),
+            "additional_data": self.additional_data
+        }
+    
+    def to_api_dict(self) -> Dict:
+        """Like to_dict, with the scores rounded to 3 decimals for API responses"""
+        data = self.to_dict()
+        data["risk_score"] = round(self.risk_score, 3)
+        data["likelihood"] = round(self.likelihood, 3)
+        data["impact"] = round(self.impact, 3)
+        return data
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskIdentificationResult:
     """Standardized result structure for risk identification (backward compatibility)"""
     asset_id: str
@@ -68,6 +107,138 @@ class RiskIdentificationResult:
     timestamp: datetime
 
 
+@dataclass(frozen=True, slots=True)
+class _NISTThreatSource:
+    """NIST SP 800-30 threat source characteristics"""
+    id: str
+    name: str
+    type: str
+    capability: str
+    intent: str
+    targeting: str
+
+
+# Common threat scenarios based on ISO 27005 Annex C
+_STANDARD_THREATS = (
+    ThreatScenario(
+        threat_id="T001",
+        threat_name="Unauthorized Access",
+        threat_source="External Attacker",
+        threat_category="technical",
+        likelihood=0.6,
+        impact_confidentiality=0.8,
+        impact_integrity=0.3,
+        impact_availability=0.2,
+        description="Unauthorized individuals gaining access to information systems"
+    ),
+    ThreatScenario(
+        threat_id="T002",
+        threat_name="Data Breach",
+        threat_source="Internal/External",
+        threat_category="technical",
+        likelihood=0.4,
+        impact_confidentiality=0.9,
+        impact_integrity=0.7,
+        impact_availability=0.3,
+        description="Unauthorized disclosure of sensitive information"
+    ),
+    ThreatScenario(
+        threat_id="T003",
+        threat_name="System Failure",
+        threat_source="Technical Failure",
+        threat_category="technical",
+        likelihood=0.3,
+        impact_confidentiality=0.1,
+        impact_integrity=0.6,
+        impact_availability=0.9,
+        description="Hardware or software system failures affecting availability"
+    ),
+    ThreatScenario(
+        threat_id="T004",
+        threat_name="Malware Attack",
+        threat_source="External Attacker",
+        threat_category="technical",
+        likelihood=0.7,
+        impact_confidentiality=0.6,
+        impact_integrity=0.8,
+        impact_availability=0.7,
+        description="Malicious software compromising system integrity and availability"
+    ),
+    ThreatScenario(
+        threat_id="T005",
+        threat_name="Insider Threat",
+        threat_source="Internal Employee",
+        threat_category="human",
+        likelihood=0.2,
+        impact_confidentiality=0.8,
+        impact_integrity=0.7,
+        impact_availability=0.4,
+        description="Malicious or negligent actions by authorized personnel"
+    ),
+    ThreatScenario(
+        threat_id="T006",
+        threat_name="Natural Disaster",
+        threat_source="Environmental",
+        threat_category="physical",
+        likelihood=0.1,
+        impact_confidentiality=0.2,
+        impact_integrity=0.3,
+        impact_availability=0.9,
+        description="Natural disasters affecting physical infrastructure"
+    )
+)
+
+# Asset vulnerabilities implied by a weak (< 0.5) CIA score
+_CONF_VULNS = (
+    "Weak access controls",
+    "Insufficient data encryption",
+    "Inadequate user authentication"
+)
+_INT_VULNS = (
+    "Lack of data validation",
+    "Insufficient change management",
+    "Weak data integrity controls"
+)
+_AVAIL_VULNS = (
+    "Single points of failure",
+    "Inadequate backup systems",
+    "Insufficient redundancy"
+)
+
+# Array view of the threat catalogue, shared by all identifiers:
+# one row per threat of [likelihood, impact_c, impact_i, impact_a]
+_THREAT_METRICS = np.array([
+    [t.likelihood, t.impact_confidentiality, t.impact_integrity, t.impact_availability]
+    for t in _STANDARD_THREATS
+])
+_THREAT_METRICS.setflags(write=False)
+_THREAT_LIKELIHOODS = _THREAT_METRICS[:, 0]
+_IMPACT_MATRIX = _THREAT_METRICS[:, 1:]
+_AVG_IMPACT = _IMPACT_MATRIX.sum(axis=1) / 3
+_AVG_IMPACT.setflags(write=False)
+_THREAT_POSITIONS = {t.threat_id: k for k, t in enumerate(_STANDARD_THREATS)}
+
+# Catalogue threats grouped by ISO 27005 threat category
+_THREATS_BY_CATEGORY = {
+    category: tuple(t for t in _STANDARD_THREATS if t.threat_category == category)
+    for category in ('physical', 'technical', 'human', 'organizational')
+}
+
+# Industry keyword -> prioritised threats, checked in order (financial wins over healthcare)
+_INDUSTRY_THREATS = {
+    # Financial sector faces higher cyber threats
+    'financial': _THREATS_BY_CATEGORY['technical'] + _THREATS_BY_CATEGORY['human'],
+    'banking': _THREATS_BY_CATEGORY['technical'] + _THREATS_BY_CATEGORY['human'],
+    # Healthcare faces data privacy and availability threats
+    'healthcare': tuple(
+        t for t in _STANDARD_THREATS
+        if 'data' in t.threat_name.lower() or 'system' in t.threat_name.lower()
+    ),
+}
+
+_INDUSTRY_TOKEN_PATTERN = re.compile(r'[a-z]+')
+
+
 class ISO27005RiskIdentification:
     """
     ISO 27005:2022 compliant risk identification framework
@@ -83,77 +254,39 @@ class ISO27005RiskIdentification:
     }
     
     # Common threat scenarios based on ISO 27005 Annex C
-    STANDARD_THREATS = [
-        ThreatScenario(
-            threat_id="T001",
-            threat_name="Unauthorized Access",
-            threat_source="External Attacker",
-            threat_category="technical",
-            likelihood=0.6,
-            impact_confidentiality=0.8,
-            impact_integrity=0.3,
-            impact_availability=0.2,
-            description="Unauthorized individuals gaining access to information systems"
+    STANDARD_THREATS = _STANDARD_THREATS
+    
+    # Systemic vulnerabilities implied by each threat category
+    _VULNS_BY_CATEGORY: Dict[str, Tuple[str, ...]] = {
+        'technical': (
+            "Outdated software systems",
+            "Insufficient network security",
+            "Weak endpoint protection"
         ),
-        ThreatScenario(
-            threat_id="T002",
-            threat_name="Data Breach",
-            threat_source="Internal/External",
-            threat_category="technical",
-            likelihood=0.4,
-            impact_confidentiality=0.9,
-            impact_integrity=0.7,
-            impact_availability=0.3,
-            description="Unauthorized disclosure of sensitive information"
+        'human': (
+            "Inadequate security awareness training",
+            "Weak access management processes",
+            "Insufficient background checks"
         ),
-        ThreatScenario(
-            threat_id="T003",
-            threat_name="System Failure",
-            threat_source="Technical Failure",
-            threat_category="technical",
-            likelihood=0.3,
-            impact_confidentiality=0.1,
-            impact_integrity=0.6,
-            impact_availability=0.9,
-            description="Hardware or software system failures affecting availability"
+        'physical': (
+            "Inadequate physical security controls",
+            "Insufficient environmental monitoring",
+            "Lack of disaster recovery planning"
         ),
-        ThreatScenario(
-            threat_id="T004",
-            threat_name="Malware Attack",
-            threat_source="External Attacker",
-            threat_category="technical",
-            likelihood=0.7,
-            impact_confidentiality=0.6,
-            impact_integrity=0.8,
-            impact_availability=0.7,
-            description="Malicious software compromising system integrity and availability"
-        ),
-        ThreatScenario(
-            threat_id="T005",
-            threat_name="Insider Threat",
-            threat_source="Internal Employee",
-            threat_category="human",
-            likelihood=0.2,
-            impact_confidentiality=0.8,
-            impact_integrity=0.7,
-            impact_availability=0.4,
-            description="Malicious or negligent actions by authorized personnel"
-        ),
-        ThreatScenario(
-            threat_id="T006",
-            threat_name="Natural Disaster",
-            threat_source="Environmental",
-            threat_category="physical",
-            likelihood=0.1,
-            impact_confidentiality=0.2,
-            impact_integrity=0.3,
-            impact_availability=0.9,
-            description="Natural disasters affecting physical infrastructure"
+        'organizational': (
+            "Weak security governance",
+            "Insufficient security policies",
+            "Inadequate incident response procedures"
         )
-    ]
+    }
     
     def __init__(self):
-        self.threats = self.STANDARD_THREATS.copy()
+        # Threats are never mutated, so every instance shares the catalogue
+        self.threats = self.STANDARD_THREATS
+    
+    def _threat_indices(self, threats: List[ThreatScenario]) -> np.ndarray:
+        """Positions of the given threats in the catalogue arrays"""
+        return np.array([_THREAT_POSITIONS[t.threat_id] for t in threats], dtype=np.intp)
     
     def asset_based_identification(
         self,
@@ -163,7 +296,8 @@ class ISO27005RiskIdentification:
         availability: float,
         classification_value: float,
         asset_category: str = None,
-        industry_sector: str = None
+        industry_sector: str = None,
+        _timestamp: datetime = None
     ) -> RiskIdentificationResult:
         """
         ISO 27005 Asset-based risk identification approach
@@ -176,30 +310,16 @@ class ISO27005RiskIdentification:
             classification_value: Asset classification score (0-1)
             asset_category: Optional asset category for threat filtering
             industry_sector: Optional industry for threat customization
+            _timestamp: Assessment time shared by a calling assessment (defaults to now)
             
         Returns:
             RiskIdentificationResult with comprehensive risk assessment
         """
-        # Step 1: Calculate base risk index using fuzzy logic (existing implementation)
-        from .compute_risk_level import compute_risk_level
-        risk_index = compute_risk_level(confidentiality, integrity, availability, classification_value)
-        
-        # Step 2: Identify relevant threats based on asset characteristics
-        relevant_threats = self._identify_asset_threats(
-            confidentiality, integrity, availability, asset_category, industry_sector
-        )
-        
-        # Step 3: Identify vulnerabilities based on CIA scores
-        vulnerabilities = self._identify_vulnerabilities(confidentiality, integrity, availability)
-        
-        # Step 4: Calculate likelihood based on threat landscape and asset exposure
-        likelihood = self._calculate_asset_likelihood(
-            confidentiality, integrity, availability, relevant_threats
-        )
-        
-        # Step 5: Calculate probability of harm (ISO 27005 requirement)
-        probability_of_harm = self._calculate_probability_of_harm(
-            risk_index, likelihood, relevant_threats
+        risk_index, relevant_threats, vulnerabilities, likelihood, probability_of_harm = (
+            self._compute_asset_core(
+                confidentiality, integrity, availability, classification_value,
+                asset_category, industry_sector
+            )
         )
         
         return RiskIdentificationResult(
@@ -211,14 +331,15 @@ class ISO27005RiskIdentification:
             vulnerabilities=vulnerabilities,
             methodology="ISO 27005:2022 Asset-based Risk Identification",
             iso27005_compliant=True,
-            timestamp=datetime.now()
+            timestamp=_timestamp or datetime.now()
         )
     
     def event_based_identification(
         self,
         asset_id: str,
         threat_scenarios: List[str] = None,
-        organizational_context: Dict = None
+        organizational_context: Dict = None,
+        _timestamp: datetime = None
     ) -> RiskIdentificationResult:
         """
         ISO 27005 Event-based risk identification approach
@@ -228,21 +349,14 @@ class ISO27005RiskIdentification:
             asset_id: Unique asset identifier
             threat_scenarios: List of specific threat scenario IDs to evaluate
             organizational_context: Context about organization (industry, size, etc.)
+            _timestamp: Assessment time shared by a calling assessment (defaults to now)
             
         Returns:
             RiskIdentificationResult with event-based risk assessment
         """
-        # Step 1: Select relevant threat scenarios
-        if threat_scenarios:
-            relevant_threats = [t for t in self.threats if t.threat_id in threat_scenarios]
-        else:
-            relevant_threats = self._select_contextual_threats(organizational_context)
-        
-        # Step 2: Calculate aggregate risk metrics from threat scenarios
-        risk_metrics = self._calculate_event_based_metrics(relevant_threats)
-        
-        # Step 3: Identify systemic vulnerabilities from threat analysis
-        vulnerabilities = self._identify_systemic_vulnerabilities(relevant_threats)
+        relevant_threats, risk_metrics, vulnerabilities = self._compute_event_core(
+            threat_scenarios, organizational_context
+        )
         
         return RiskIdentificationResult(
             asset_id=asset_id,
@@ -253,7 +367,7 @@ class ISO27005RiskIdentification:
             vulnerabilities=vulnerabilities,
             methodology="ISO 27005:2022 Event-based Risk Identification",
             iso27005_compliant=True,
-            timestamp=datetime.now()
+            timestamp=_timestamp or datetime.now()
         )
     
     def hybrid_identification(
@@ -264,46 +378,206 @@ class ISO27005RiskIdentification:
         availability: float,
         classification_value: float,
         threat_scenarios: List[str] = None,
-        organizational_context: Dict = None
+        organizational_context: Dict = None,
+        _timestamp: datetime = None
     ) -> RiskIdentificationResult:
         """
         Combined asset-based and event-based risk identification
         Provides the most comprehensive risk assessment per ISO 27005:2022
         """
-        # Perform both approaches
-        asset_result = self.asset_based_identification(
-            asset_id, confidentiality, integrity, availability, classification_value
+        # One timestamp for the combined assessment
+        timestamp = _timestamp or datetime.now()
+        
+        # Perform both approaches on shared intermediates, without building
+        # the standalone asset-based and event-based results
+        (asset_risk_index, asset_threats, asset_vulnerabilities,
+         asset_likelihood, asset_probability) = self._compute_asset_core(
+            confidentiality, integrity, availability, classification_value
         )
         
-        event_result = self.event_based_identification(
-            asset_id, threat_scenarios, organizational_context
+        event_threats, event_metrics, event_vulnerabilities = self._compute_event_core(
+            threat_scenarios, organizational_context
         )
         
         # Combine results using weighted approach
-        combined_risk_index = (asset_result.risk_index * 0.6) + (event_result.risk_index * 0.4)
-        combined_likelihood = (asset_result.likelihood * 0.6) + (event_result.likelihood * 0.4)
-        combined_probability = (asset_result.probability_of_harm * 0.6) + (event_result.probability_of_harm * 0.4)
+        combined_risk_index = (asset_risk_index * 0.6) + (event_metrics['risk_index'] * 0.4)
+        combined_likelihood = (asset_likelihood * 0.6) + (event_metrics['likelihood'] * 0.4)
+        combined_probability = (asset_probability * 0.6) + (event_metrics['probability_of_harm'] * 0.4)
         
         # Merge threat lists (remove duplicates)
-        all_threats = asset_result.identified_threats + [
-            t for t in event_result.identified_threats 
-            if t.threat_id not in [at.threat_id for at in asset_result.identified_threats]
+        asset_threat_ids = {at.threat_id for at in asset_threats}
+        all_threats = asset_threats + [
+            t for t in event_threats 
+            if t.threat_id not in asset_threat_ids
         ]
         
-        # Merge vulnerability lists
-        all_vulnerabilities = list(set(asset_result.vulnerabilities + event_result.vulnerabilities))
+        # Merge vulnerability lists (dedupe while keeping first-seen order)
+        all_vulnerabilities = list(dict.fromkeys(chain(asset_vulnerabilities, event_vulnerabilities)))
         
+        # Quantize to 3 decimals with integer math (scores are non-negative)
         return RiskIdentificationResult(
             asset_id=asset_id,
-            risk_index=round(combined_risk_index, 3),
-            likelihood=round(combined_likelihood, 3),
-            probability_of_harm=round(combined_probability, 3),
+            risk_index=int(combined_risk_index * 1000 + 0.5) / 1000.0,
+            likelihood=int(combined_likelihood * 1000 + 0.5) / 1000.0,
+            probability_of_harm=int(combined_probability * 1000 + 0.5) / 1000.0,
             identified_threats=all_threats,
             vulnerabilities=all_vulnerabilities,
             methodology="ISO 27005:2022 Hybrid Risk Identification (Asset-based + Event-based)",
             iso27005_compliant=True,
-            timestamp=datetime.now()
+            timestamp=timestamp
+        )
+    
+    def batch_asset_based_identification(
+        self,
+        asset_ids: List[str],
+        cia_matrix
+    ) -> List[RiskIdentificationResult]:
+        """
+        Asset-based risk identification for many assets at once
+        
+        Threat relevance, likelihood and probability of harm are computed as
+        NumPy array operations over all assets; only the fuzzy risk index and
+        the per-asset result objects are produced in Python.
+        
+        Args:
+            asset_ids: Unique asset identifiers, one per row
+            cia_matrix: (M, 4) array-like of [confidentiality, integrity,
+                availability, classification_value] scores (0-1)
+            
+        Returns:
+            List of RiskIdentificationResult, in row order
+        """
+        cia = np.asarray(cia_matrix, dtype=np.float64).reshape(-1, 4)
+        confidentiality, integrity, availability, classification = cia.T
+        timestamp = datetime.now()
+        
+        # Step 1: Calculate base risk index using fuzzy logic (per asset)
+        risk_indices = np.array([
+            compute_risk_level(c, i, a, cv)
+            for c, i, a, cv in cia.tolist()
+        ])
+        
+        # Step 2: (M, N) threat relevance and selection mask
+        relevance_scores = (
+            confidentiality[:, None] * _IMPACT_MATRIX[:, 0] +
+            integrity[:, None] * _IMPACT_MATRIX[:, 1] +
+            availability[:, None] * _IMPACT_MATRIX[:, 2]
+        ) / 3
+        selected = relevance_scores >= 0.3
+        counts = selected.sum(axis=1)
+        has_threats = counts > 0
+        safe_counts = np.maximum(counts, 1)
+        
+        # Step 4: Likelihood from asset exposure and mean selected threat likelihood
+        base_likelihood = (confidentiality + integrity + availability) / 3
+        threat_likelihood = np.where(selected, _THREAT_LIKELIHOODS, 0.0).sum(axis=1) / safe_counts
+        likelihood = np.minimum((base_likelihood * 0.4) + (threat_likelihood * 0.6), 1.0)
+        likelihood = np.where(has_threats, np.floor(likelihood * 1000 + 0.5) / 1000.0, 0.0)
+        
+        # Step 5: Probability of harm from mean selected threat impact
+        avg_impact = np.where(selected, _AVG_IMPACT, 0.0).sum(axis=1) / safe_counts
+        probability_of_harm = np.minimum(likelihood * avg_impact * (1 + risk_indices * 0.2), 1.0)
+        probability_of_harm = np.where(
+            has_threats, np.floor(probability_of_harm * 1000 + 0.5) / 1000.0, risk_indices
+        )
+        
+        return [
+            RiskIdentificationResult(
+                asset_id=asset_id,
+                risk_index=risk_index,
+                likelihood=row_likelihood,
+                probability_of_harm=row_probability,
+                identified_threats=[self.threats[k] for k in np.flatnonzero(row_selected)],
+                vulnerabilities=self._identify_vulnerabilities(c, i, a),
+                methodology="ISO 27005:2022 Asset-based Risk Identification",
+                iso27005_compliant=True,
+                timestamp=timestamp
+            )
+            for asset_id, risk_index, row_likelihood, row_probability, row_selected, (c, i, a, _) in zip(
+                asset_ids, risk_indices.tolist(), likelihood.tolist(),
+                probability_of_harm.tolist(), selected, cia.tolist()
+            )
+        ]
+    
+    def _compute_asset_core(
+        self,
+        confidentiality: float,
+        integrity: float,
+        availability: float,
+        classification_value: float,
+        asset_category: str = None,
+        industry_sector: str = None
+    ) -> Tuple[float, List[ThreatScenario], List[str], float, float]:
+        """
+        Asset-based intermediates shared by asset-based and hybrid identification
+        
+        Returns:
+            Tuple of (risk_index, threats, vulnerabilities, likelihood, probability_of_harm)
+        """
+        # Step 1: Calculate base risk index using fuzzy logic (existing implementation)
+        risk_index = compute_risk_level(confidentiality, integrity, availability, classification_value)
+        
+        # Step 2: Identify relevant threats based on asset characteristics
+        indices = self._asset_threat_indices(confidentiality, integrity, availability)
+        relevant_threats = [self.threats[k] for k in indices]
+        
+        # Step 3: Identify vulnerabilities based on CIA scores
+        vulnerabilities = self._identify_vulnerabilities(confidentiality, integrity, availability)
+        
+        # Step 4: Calculate likelihood based on threat landscape and asset exposure
+        likelihood = self._calculate_asset_likelihood(
+            confidentiality, integrity, availability, relevant_threats, indices
+        )
+        
+        # Step 5: Calculate probability of harm (ISO 27005 requirement)
+        probability_of_harm = self._calculate_probability_of_harm(
+            risk_index, likelihood, relevant_threats, indices
         )
+        
+        return risk_index, relevant_threats, vulnerabilities, likelihood, probability_of_harm
+    
+    def _compute_event_core(
+        self,
+        threat_scenarios: List[str] = None,
+        organizational_context: Dict = None
+    ) -> Tuple[List[ThreatScenario], Dict[str, float], List[str]]:
+        """
+        Event-based intermediates shared by event-based and hybrid identification
+        
+        Returns:
+            Tuple of (threats, risk_metrics, vulnerabilities)
+        """
+        # Step 1: Select relevant threat scenarios
+        if threat_scenarios:
+            relevant_threats = [t for t in self.threats if t.threat_id in threat_scenarios]
+        else:
+            relevant_threats = self._select_contextual_threats(organizational_context)
+        
+        # Step 2: Calculate aggregate risk metrics from threat scenarios
+        risk_metrics = self._calculate_event_based_metrics(relevant_threats)
+        
+        # Step 3: Identify systemic vulnerabilities from threat analysis
+        vulnerabilities = self._identify_systemic_vulnerabilities(relevant_threats)
+        
+        return relevant_threats, risk_metrics, vulnerabilities
+    
+    def _asset_threat_indices(
+        self,
+        confidentiality: float,
+        integrity: float,
+        availability: float
+    ) -> np.ndarray:
+        """Catalogue positions of threats relevant to the asset's CIA profile"""
+        # Calculate threat relevance based on CIA impact alignment, for all threats at once
+        impacts = _IMPACT_MATRIX
+        relevance_scores = (
+            impacts[:, 0] * confidentiality +
+            impacts[:, 1] * integrity +
+            impacts[:, 2] * availability
+        ) / 3
+        
+        # Include threats with relevance above threshold
+        return np.flatnonzero(relevance_scores >= 0.3)
     
     def _identify_asset_threats(
         self, 
@@ -314,21 +588,10 @@ class ISO27005RiskIdentification:
         industry_sector: str = None
     ) -> List[ThreatScenario]:
         """Identify threats relevant to specific asset characteristics"""
-        relevant_threats = []
-        
-        for threat in self.threats:
-            # Calculate threat relevance based on CIA impact alignment
-            relevance_score = (
-                threat.impact_confidentiality * confidentiality +
-                threat.impact_integrity * integrity +
-                threat.impact_availability * availability
-            ) / 3
-            
-            # Include threats with relevance above threshold
-            if relevance_score >= 0.3:
-                relevant_threats.append(threat)
-        
-        return relevant_threats
+        return [
+            self.threats[k]
+            for k in self._asset_threat_indices(confidentiality, integrity, availability)
+        ]
     
     def _identify_vulnerabilities(
         self, 
@@ -337,37 +600,23 @@ class ISO27005RiskIdentification:
         availability: float
     ) -> List[str]:
         """Identify vulnerabilities based on CIA assessment"""
-        vulnerabilities = []
-        
-        if confidentiality < 0.5:
-            vulnerabilities.extend([
-                "Weak access controls",
-                "Insufficient data encryption",
-                "Inadequate user authentication"
-            ])
-        
-        if integrity < 0.5:
-            vulnerabilities.extend([
-                "Lack of data validation",
-                "Insufficient change management",
-                "Weak data integrity controls"
-            ])
-        
-        if availability < 0.5:
-            vulnerabilities.extend([
-                "Single points of failure",
-                "Inadequate backup systems",
-                "Insufficient redundancy"
-            ])
-        
-        return vulnerabilities
+        return list(chain.from_iterable(
+            vulnerabilities
+            for score, vulnerabilities in (
+                (confidentiality, _CONF_VULNS),
+                (integrity, _INT_VULNS),
+                (availability, _AVAIL_VULNS)
+            )
+            if score < 0.5
+        ))
     
     def _calculate_asset_likelihood(
         self, 
         confidentiality: float, 
         integrity: float, 
         availability: float,
-        threats: List[ThreatScenario]
+        threats: List[ThreatScenario],
+        indices: np.ndarray = None
     ) -> float:
         """Calculate likelihood based on asset exposure and threat landscape"""
         if not threats:
@@ -377,114 +626,94 @@ class ISO27005RiskIdentification:
         base_likelihood = (confidentiality + integrity + availability) / 3
         
         # Adjust based on threat likelihood
-        threat_likelihood = sum(t.likelihood for t in threats) / len(threats)
+        if indices is None:
+            indices = self._threat_indices(threats)
+        threat_likelihood = float(_THREAT_LIKELIHOODS[indices].mean())
         
         # Combined likelihood using ISO 27005 approach
         combined_likelihood = min((base_likelihood * 0.4) + (threat_likelihood * 0.6), 1.0)
         
-        return round(combined_likelihood, 3)
+        return int(combined_likelihood * 1000 + 0.5) / 1000.0
     
     def _calculate_probability_of_harm(
         self, 
         risk_index: float, 
         likelihood: float, 
-        threats: List[ThreatScenario]
+        threats: List[ThreatScenario],
+        indices: np.ndarray = None
     ) -> float:
         """Calculate probability of harm per ISO 27005 methodology"""
         if not threats:
             return risk_index
         
         # Average impact across all CIA dimensions for identified threats
-        avg_impact = sum(
-            (t.impact_confidentiality + t.impact_integrity + t.impact_availability) / 3
-            for t in threats
-        ) / len(threats)
+        if indices is None:
+            indices = self._threat_indices(threats)
+        avg_impact = float(_AVG_IMPACT[indices].mean())
         
         # ISO 27005 probability of harm formula
         probability_of_harm = min(likelihood * avg_impact * (1 + risk_index * 0.2), 1.0)
         
-        return round(probability_of_harm, 3)
+        return int(probability_of_harm * 1000 + 0.5) / 1000.0
     
     def _select_contextual_threats(self, organizational_context: Dict = None) -> List[ThreatScenario]:
         """Select threats based on organizational context"""
         if not organizational_context:
-            return self.threats
+            return list(self.threats)
         
         # Filter threats based on industry, size, etc.
         # This is a simplified implementation - can be expanded based on specific needs
-        relevant_threats = []
-        
-        industry = organizational_context.get('industry_sector', '').lower()
+        industry_tokens = set(
+            _INDUSTRY_TOKEN_PATTERN.findall((organizational_context.get('industry_sector') or '').lower())
+        )
         
         # Industry-specific threat prioritization
-        if 'financial' in industry or 'banking' in industry:
-            # Financial sector faces higher cyber threats
-            relevant_threats = [t for t in self.threats if t.threat_category in ['technical', 'human']]
-        elif 'healthcare' in industry:
-            # Healthcare faces data privacy and availability threats
-            relevant_threats = [t for t in self.threats if 'data' in t.threat_name.lower() or 'system' in t.threat_name.lower()]
-        else:
-            # Default to all threats
-            relevant_threats = self.threats
+        for industry, threats in _INDUSTRY_THREATS.items():
+            if industry in industry_tokens:
+                return list(threats)
         
-        return relevant_threats
+        # Default to all threats
+        return list(self.threats)
     
     def _calculate_event_based_metrics(self, threats: List[ThreatScenario]) -> Dict[str, float]:
         """Calculate risk metrics from threat scenarios"""
         if not threats:
             return {'risk_index': 0.0, 'likelihood': 0.0, 'probability_of_harm': 0.0}
         
-        # Aggregate threat likelihoods
-        avg_likelihood = sum(t.likelihood for t in threats) / len(threats)
+        # Aggregate likelihood and CIA impacts in one pass over the selected rows
+        means = _THREAT_METRICS[self._threat_indices(threats)].mean(axis=0)
+        avg_likelihood = float(means[0])
         
-        # Calculate composite impact
-        avg_confidentiality_impact = sum(t.impact_confidentiality for t in threats) / len(threats)
-        avg_integrity_impact = sum(t.impact_integrity for t in threats) / len(threats)
-        avg_availability_impact = sum(t.impact_availability for t in threats) / len(threats)
-        
-        # Risk index from threat analysis
-        risk_index = (avg_confidentiality_impact + avg_integrity_impact + avg_availability_impact) / 3
+        # Risk index from threat analysis (composite impact)
+        risk_index = float(means[1:].mean())
         
         # Probability of harm
         probability_of_harm = min(avg_likelihood * risk_index, 1.0)
         
         return {
-            'risk_index': round(risk_index, 3),
-            'likelihood': round(avg_likelihood, 3),
-            'probability_of_harm': round(probability_of_harm, 3)
+            'risk_index': int(risk_index * 1000 + 0.5) / 1000.0,
+            'likelihood': int(avg_likelihood * 1000 + 0.5) / 1000.0,
+            'probability_of_harm': int(probability_of_harm * 1000 + 0.5) / 1000.0
         }
     
     def _identify_systemic_vulnerabilities(self, threats: List[ThreatScenario]) -> List[str]:
         """Identify systemic vulnerabilities from threat analysis"""
-        vulnerabilities = set()
-        
-        for threat in threats:
-            if threat.threat_category == 'technical':
-                vulnerabilities.update([
-                    "Outdated software systems",
-                    "Insufficient network security",
-                    "Weak endpoint protection"
-                ])
-            elif threat.threat_category == 'human':
-                vulnerabilities.update([
-                    "Inadequate security awareness training",
-                    "Weak access management processes",
-                    "Insufficient background checks"
-                ])
-            elif threat.threat_category == 'physical':
-                vulnerabilities.update([
-                    "Inadequate physical security controls",
-                    "Insufficient environmental monitoring",
-                    "Lack of disaster recovery planning"
-                ])
-            elif threat.threat_category == 'organizational':
-                vulnerabilities.update([
-                    "Weak security governance",
-                    "Insufficient security policies",
-                    "Inadequate incident response procedures"
-                ])
-        
-        return list(vulnerabilities)
+        # Categories in first-seen order, so the result order is deterministic
+        categories = dict.fromkeys(threat.threat_category for threat in threats)
+        
+        return list(dict.fromkeys(chain.from_iterable(
+            self._VULNS_BY_CATEGORY[category]
+            for category in categories
+            if category in self._VULNS_BY_CATEGORY
+        )))
+
+
+# (label, attribute) of the ISO 27005 metrics that must lie in [0, 1]
+_ISO27005_RANGE_CHECKS = (
+    ("Risk index", "risk_index"),
+    ("Likelihood", "likelihood"),
+    ("Probability of harm", "probability_of_harm")
+)
 
 
 def validate_iso27005_compliance(result: RiskIdentificationResult) -> Dict[str, any]:
@@ -497,18 +726,15 @@ def validate_iso27005_compliance(result: RiskIdentificationResult) -> Dict[str,
     Returns:
         Dict with compliance status and recommendations
     """
-    compliance_issues = []
-    recommendations = []
+    metrics = [getattr(result, attr) for _, attr in _ISO27005_RANGE_CHECKS]
     
     # Check required components
-    if result.risk_index is None or not (0 <= result.risk_index <= 1):
-        compliance_issues.append("Risk index must be between 0 and 1")
-    
-    if result.likelihood is None or not (0 <= result.likelihood <= 1):
-        compliance_issues.append("Likelihood must be between 0 and 1")
-    
-    if result.probability_of_harm is None or not (0 <= result.probability_of_harm <= 1):
-        compliance_issues.append("Probability of harm must be between 0 and 1")
+    compliance_issues = [
+        f"{label} must be between 0 and 1"
+        for (label, _), value in zip(_ISO27005_RANGE_CHECKS, metrics)
+        if value is None or not (0 <= value <= 1)
+    ]
+    recommendations = []
     
     if not result.identified_threats:
         recommendations.append("Consider identifying specific threat scenarios for more comprehensive assessment")
@@ -529,61 +755,212 @@ def validate_iso27005_compliance(result: RiskIdentificationResult) -> Dict[str,
         "assessment_completeness": {
             "threats_identified": len(result.identified_threats),
             "vulnerabilities_identified": len(result.vulnerabilities),
-            "risk_metrics_calculated": all([
-                result.risk_index is not None,
-                result.likelihood is not None,
-                result.probability_of_harm is not None
-            ])
+            "risk_metrics_calculated": None not in metrics
         }
     }
 
 
+# Risk level lower bounds (inclusive) for each methodology; a score's level is
+# _RISK_LEVELS[bisect_right(thresholds, score)]
+_RISK_LEVELS = ("Very Low", "Low", "Moderate", "High", "Very High")
+_NIST_RISK_THRESHOLDS = (0.04, 0.16, 0.36, 0.64)
+_ISO_RISK_THRESHOLDS = (0.25, 0.5, 0.75, 0.9)
+_INTEGRATED_RISK_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_OCTAVE_RISK_LEVELS = ("Low", "Moderate", "High")
+_OCTAVE_RISK_THRESHOLDS = (0.4, 0.7)
+
+# Asset criticality levels by business_criticality lower bound (inclusive)
+_CRITICALITY_LEVELS = ("low", "moderate", "high", "critical")
+_CRITICALITY_THRESHOLDS = (0.4, 0.6, 0.8)
+
+# Criticalities that draw adversarial threat sources and raise their likelihood
+_ELEVATED_CRITICALITIES = frozenset(("high", "critical"))
+
+# NIST impact weight per asset criticality
+_NIST_CRITICALITY_WEIGHTS = MappingProxyType({
+    "low": 0.8,
+    "moderate": 1.0,
+    "high": 1.2,
+    "critical": 1.4
+})
+
+# NIST base likelihood per threat source
+_BASE_THREAT_LIKELIHOODS = MappingProxyType({
+    "Cyber Criminals": 0.7,
+    "Nation State Actors": 0.3,
+    "Insider Threats": 0.2,
+    "Natural Disasters": 0.1
+})
+
+# NIST recommendations per risk level. Shared tuples, so callers must not mutate them.
+_NIST_RECOMMENDATIONS = MappingProxyType({
+    "Very High": (
+        "Implement immediate security controls",
+        "Activate incident response procedures",
+        "Conduct emergency risk review",
+        "Consider asset isolation if necessary"
+    ),
+    "High": (
+        "Prioritize security control implementation",
+        "Increase monitoring frequency", 
+        "Review and update security policies",
+        "Conduct quarterly risk assessments"
+    ),
+    "Moderate": (
+        "Implement recommended security controls",
+        "Conduct semi-annual risk reviews",
+        "Maintain current monitoring levels",
+        "Update security awareness training"
+    ),
+    "Low": (
+        "Continue routine monitoring",
+        "Annual risk assessment",
+        "Maintain current security controls",
+        "Document risk acceptance"
+    ),
+    "Very Low": (
+        "Routine monitoring sufficient",
+        "Biennial risk review",
+        "Standard security controls adequate"
+    )
+})
+
+_NIST_MODERATE_RECOMMENDATIONS = _NIST_RECOMMENDATIONS["Moderate"]
+
+# OCTAVE business impact per asset criticality
+_BUSINESS_IMPACTS = MappingProxyType({
+    "low": 0.3,
+    "moderate": 0.5, 
+    "high": 0.8,
+    "critical": 1.0
+})
+
+# OCTAVE organizational vulnerabilities and technology threats; results get
+# fresh copies of these entries, never the shared dicts
+_ORG_VULNERABILITIES = (
+    {
+        "type": "organizational",
+        "name": "Inadequate Security Awareness",
+        "description": "Lack of security awareness among staff"
+    },
+    {
+        "type": "organizational", 
+        "name": "Insufficient Security Policies",
+        "description": "Inadequate or outdated security policies"
+    }
+)
+_TECHNOLOGY_THREATS = (
+    {
+        "threat_id": "OCTAVE-T1",
+        "name": "System Compromise",
+        "description": "Unauthorized access to system resources",
+        "likelihood": 0.6
+    },
+    {
+        "threat_id": "OCTAVE-T2", 
+        "name": "Data Corruption",
+        "description": "Intentional or accidental data corruption",
+        "likelihood": 0.3
+    }
+)
+
+# OCTAVE recommendations: base set plus risk-level specific additions
+_OCTAVE_BASE_RECOMMENDATIONS = (
+    "Develop comprehensive security awareness program",
+    "Implement asset-centric security controls",
+    "Establish regular risk assessment procedures",
+    "Create incident response capabilities"
+)
+_OCTAVE_RECOMMENDATIONS = MappingProxyType({
+    "High": _OCTAVE_BASE_RECOMMENDATIONS + (
+        "Immediate security control implementation",
+        "Enhanced monitoring and detection",
+        "Executive-level risk communication"
+    ),
+    "Moderate": _OCTAVE_BASE_RECOMMENDATIONS + (
+        "Prioritized security improvements",
+        "Quarterly risk reviews",
+        "Staff security training"
+    )
+})
+
+
+@lru_cache(maxsize=256)
+def _threat_likelihood_cached(threat_name: str, criticality: str) -> float:
+    """NIST threat likelihood for a threat source name and lowercase asset criticality"""
+    base_likelihood = _BASE_THREAT_LIKELIHOODS.get(threat_name, 0.5)
+    
+    # Adjust based on asset criticality
+    if criticality in _ELEVATED_CRITICALITIES:
+        base_likelihood *= 1.3
+    
+    return min(base_likelihood, 1.0)
+
+
+@lru_cache(maxsize=64)
+def _business_impact_cached(criticality: str) -> float:
+    """OCTAVE business impact for a lowercase asset criticality"""
+    return _BUSINESS_IMPACTS.get(criticality, 0.5)
+
+
+# NIST tier per assessment scope (anything else is tier 3, Information System)
+_NIST_TIERS = {
+    "organization": 1,
+    "mission_business_process": 2
+}
+
+
 class NISTRiskIdentification:
     """
     NIST SP 800-30 Rev 1 Implementation
     Three-tiered risk assessment approach
     """
     
-    def __init__(self):
-        self.threat_sources = [
-            {
-                "id": "TS-1",
-                "name": "Cyber Criminals",
-                "type": "adversarial",
-                "capability": "high",
-                "intent": "financial_gain",
-                "targeting": "opportunistic"
-            },
-            {
-                "id": "TS-2", 
-                "name": "Nation State Actors",
-                "type": "adversarial",
-                "capability": "very_high",
-                "intent": "espionage",
-                "targeting": "targeted"
-            },
-            {
-                "id": "TS-3",
-                "name": "Insider Threats",
-                "type": "adversarial", 
-                "capability": "variable",
-                "intent": "malicious_negligent",
-                "targeting": "insider_knowledge"
-            },
-            {
-                "id": "TS-4",
-                "name": "Natural Disasters",
-                "type": "environmental",
-                "capability": "high",
-                "intent": "none",
-                "targeting": "geographic"
-            }
-        ]
+    # NIST SP 800-30 threat sources (Appendix D), shared by all instances
+    THREAT_SOURCES = (
+        _NISTThreatSource(
+            id="TS-1",
+            name="Cyber Criminals",
+            type="adversarial",
+            capability="high",
+            intent="financial_gain",
+            targeting="opportunistic"
+        ),
+        _NISTThreatSource(
+            id="TS-2",
+            name="Nation State Actors",
+            type="adversarial",
+            capability="very_high",
+            intent="espionage",
+            targeting="targeted"
+        ),
+        _NISTThreatSource(
+            id="TS-3",
+            name="Insider Threats",
+            type="adversarial",
+            capability="variable",
+            intent="malicious_negligent",
+            targeting="insider_knowledge"
+        ),
+        _NISTThreatSource(
+            id="TS-4",
+            name="Natural Disasters",
+            type="environmental",
+            capability="high",
+            intent="none",
+            targeting="geographic"
+        )
+    )
+    
+    # Threat sources partitioned by type for threat identification
+    _ADVERSARIAL_SOURCES = tuple(ts for ts in THREAT_SOURCES if ts.type == "adversarial")
+    _ENVIRONMENTAL_SOURCES = tuple(ts for ts in THREAT_SOURCES if ts.type == "environmental")
     
     def assess_risk(
         self, 
         asset_id: str, 
-        asset_context: Dict
+        asset_context: Dict,
+        _timestamp: datetime = None
     ) -> StandardizedRiskResult:
         """
         NIST SP 800-30 Risk Assessment
@@ -592,6 +969,9 @@ class NISTRiskIdentification:
         1. Prepare for Assessment
         2. Conduct Assessment  
         3. Communicate Results
+        
+        The optional _timestamp lets a calling assessment share one timestamp
+        across methodologies instead of reading the clock again.
         """
         
         # Step 1: Prepare for Assessment
@@ -614,10 +994,10 @@ class NISTRiskIdentification:
             vulnerabilities_identified=assessment["vulnerabilities"],
             recommendations=self._generate_nist_recommendations(risk_calculation),
             compliance_frameworks=["NIST SP 800-30 Rev 1", "NIST Cybersecurity Framework"],
-            assessment_timestamp=datetime.now(),
+            assessment_timestamp=_timestamp or datetime.now(),
             additional_data={
                 "preparation": preparation,
-                "threat_sources": self.threat_sources,
+                "threat_sources": [asdict(ts) for ts in self.THREAT_SOURCES],
                 "nist_tier": self._determine_nist_tier(asset_context)
             }
         )
@@ -663,32 +1043,32 @@ class NISTRiskIdentification:
     
     def _identify_relevant_threats(self, asset_context: Dict) -> List[Dict]:
         """Identify threats relevant to the asset"""
-        relevant_threats = []
-        
-        asset_criticality = asset_context.get("criticality", "moderate").lower()
+        asset_criticality = asset_context.get("criticality", "moderate")
         asset_type = asset_context.get("asset_type", "").lower()
         
-        for threat_source in self.threat_sources:
-            # Include adversarial threats for critical assets
-            if asset_criticality in ["high", "critical"] and threat_source["type"] == "adversarial":
-                relevant_threats.append({
-                    "threat_id": threat_source["id"],
-                    "threat_name": threat_source["name"],
-                    "threat_type": threat_source["type"],
-                    "likelihood": self._estimate_threat_likelihood(threat_source, asset_context),
-                    "description": f"{threat_source['name']} targeting {asset_type} assets"
-                })
+        # Include adversarial threats for critical assets
+        relevant_threats = [
+            {
+                "threat_id": threat_source.id,
+                "threat_name": threat_source.name,
+                "threat_type": threat_source.type,
+                "likelihood": self._estimate_threat_likelihood(threat_source, asset_context),
+                "description": f"{threat_source.name} targeting {asset_type} assets"
+            }
+            for threat_source in self._ADVERSARIAL_SOURCES
+        ] if asset_criticality in _ELEVATED_CRITICALITIES else []
         
         # Always include environmental threats
-        environmental_threats = [ts for ts in self.threat_sources if ts["type"] == "environmental"]
-        for threat_source in environmental_threats:
-            relevant_threats.append({
-                "threat_id": threat_source["id"],
-                "threat_name": threat_source["name"], 
-                "threat_type": threat_source["type"],
+        relevant_threats.extend(
+            {
+                "threat_id": threat_source.id,
+                "threat_name": threat_source.name, 
+                "threat_type": threat_source.type,
                 "likelihood": 0.2,  # Low likelihood for environmental
                 "description": f"Environmental threats affecting {asset_type} availability"
-            })
+            }
+            for threat_source in self._ENVIRONMENTAL_SOURCES
+        )
         
         return relevant_threats
     
@@ -740,16 +1120,16 @@ class NISTRiskIdentification:
             return 0.0
         
         # Average threat likelihood
-        threat_likelihood = sum(t["likelihood"] for t in threats) / len(threats)
+        threat_likelihood = fmean(t["likelihood"] for t in threats)
         
         # Vulnerability factor
-        high_severity_vulns = [v for v in vulnerabilities if v.get("severity") == "high"]
-        vuln_factor = 1.0 + (len(high_severity_vulns) * 0.15)
+        high_severity_count = sum(1 for v in vulnerabilities if v.get("severity") == "high")
+        vuln_factor = 1.0 + (high_severity_count * 0.15)
         
         # Combined likelihood
         overall_likelihood = min(threat_likelihood * vuln_factor, 1.0)
         
-        return round(overall_likelihood, 3)
+        return int(overall_likelihood * 1000 + 0.5) / 1000.0
     
     def _calculate_nist_impact(self, asset_context: Dict) -> float:
         """Calculate impact using NIST methodology"""
@@ -759,17 +1139,10 @@ class NISTRiskIdentification:
         availability = asset_context.get("availability", 0.5)
         
         # NIST impact calculation - weighted average with business criticality
-        criticality_weight = {
-            "low": 0.8,
-            "moderate": 1.0,
-            "high": 1.2,
-            "critical": 1.4
-        }
-        
-        weight = criticality_weight.get(asset_context.get("criticality", "moderate").lower(), 1.0)
+        weight = _NIST_CRITICALITY_WEIGHTS.get(asset_context.get("criticality", "moderate"), 1.0)
         base_impact = (confidentiality + integrity + availability) / 3
         
-        return round(min(base_impact * weight, 1.0), 3)
+        return int(min(base_impact * weight, 1.0) * 1000 + 0.5) / 1000.0
     
     def _calculate_nist_risk(self, assessment: Dict) -> Dict:
         """Calculate overall risk using NIST methodology"""
@@ -780,90 +1153,26 @@ class NISTRiskIdentification:
         risk_score = likelihood * impact
         
         # NIST Risk Levels
-        if risk_score >= 0.64:
-            risk_level = "Very High"
-        elif risk_score >= 0.36:
-            risk_level = "High"
-        elif risk_score >= 0.16:
-            risk_level = "Moderate"
-        elif risk_score >= 0.04:
-            risk_level = "Low"
-        else:
-            risk_level = "Very Low"
+        risk_level = _RISK_LEVELS[bisect_right(_NIST_RISK_THRESHOLDS, risk_score)]
         
         return {
-            "risk_score": round(risk_score, 3),
+            "risk_score": risk_score,
             "risk_level": risk_level,
             "likelihood_component": likelihood,
             "impact_component": impact
         }
     
-    def _estimate_threat_likelihood(self, threat_source: Dict, asset_context: Dict) -> float:
+    def _estimate_threat_likelihood(self, threat_source: _NISTThreatSource, asset_context: Dict) -> float:
         """Estimate threat likelihood based on threat source and asset context"""
-        base_likelihood_map = {
-            "Cyber Criminals": 0.7,
-            "Nation State Actors": 0.3,
-            "Insider Threats": 0.2,
-            "Natural Disasters": 0.1
-        }
-        
-        base_likelihood = base_likelihood_map.get(threat_source["name"], 0.5)
-        
-        # Adjust based on asset criticality
-        criticality = asset_context.get("criticality", "moderate").lower()
-        if criticality in ["high", "critical"]:
-            base_likelihood *= 1.3
-        
-        return min(base_likelihood, 1.0)
+        return _threat_likelihood_cached(threat_source.name, asset_context.get("criticality", "moderate"))
     
-    def _generate_nist_recommendations(self, risk_calculation: Dict) -> List[str]:
+    def _generate_nist_recommendations(self, risk_calculation: Dict) -> Tuple[str, ...]:
         """Generate NIST-based recommendations"""
-        risk_level = risk_calculation["risk_level"]
-        
-        recommendations_map = {
-            "Very High": [
-                "Implement immediate security controls",
-                "Activate incident response procedures",
-                "Conduct emergency risk review",
-                "Consider asset isolation if necessary"
-            ],
-            "High": [
-                "Prioritize security control implementation",
-                "Increase monitoring frequency", 
-                "Review and update security policies",
-                "Conduct quarterly risk assessments"
-            ],
-            "Moderate": [
-                "Implement recommended security controls",
-                "Conduct semi-annual risk reviews",
-                "Maintain current monitoring levels",
-                "Update security awareness training"
-            ],
-            "Low": [
-                "Continue routine monitoring",
-                "Annual risk assessment",
-                "Maintain current security controls",
-                "Document risk acceptance"
-            ],
-            "Very Low": [
-                "Routine monitoring sufficient",
-                "Biennial risk review",
-                "Standard security controls adequate"
-            ]
-        }
-        
-        return recommendations_map.get(risk_level, recommendations_map["Moderate"])
+        return _NIST_RECOMMENDATIONS.get(risk_calculation["risk_level"], _NIST_MODERATE_RECOMMENDATIONS)
     
     def _determine_nist_tier(self, asset_context: Dict) -> int:
         """Determine NIST tier (1=Organization, 2=Mission/Business, 3=Information System)"""
-        asset_scope = asset_context.get("scope", "single_asset")
-        
-        if asset_scope == "organization":
-            return 1
-        elif asset_scope == "mission_business_process":
-            return 2
-        else:
-            return 3
+        return _NIST_TIERS.get(asset_context.get("scope", "single_asset"), 3)
 
 
 class OCTAVERiskIdentification:
@@ -875,7 +1184,8 @@ class OCTAVERiskIdentification:
     def assess_risk(
         self, 
         asset_id: str, 
-        asset_context: Dict
+        asset_context: Dict,
+        _timestamp: datetime = None
     ) -> StandardizedRiskResult:
         """
         OCTAVE Risk Assessment
@@ -884,6 +1194,9 @@ class OCTAVERiskIdentification:
         1. Asset-based analysis
         2. Threat identification
         3. Organizational impact
+        
+        The optional _timestamp lets a calling assessment share one timestamp
+        across methodologies instead of reading the clock again.
         """
         
         # OCTAVE Phase 1: Organizational View
@@ -902,11 +1215,11 @@ class OCTAVERiskIdentification:
             risk_level=risk_analysis["risk_level"],
             likelihood=risk_analysis["likelihood"],
             impact=risk_analysis["impact"],
-            threats_identified=risk_analysis["threats"],
+            threats_identified=list(risk_analysis["threats"]),
             vulnerabilities_identified=risk_analysis["vulnerabilities"],
             recommendations=self._generate_octave_recommendations(risk_analysis),
             compliance_frameworks=["OCTAVE", "Asset-Centric Risk Management"],
-            assessment_timestamp=datetime.now(),
+            assessment_timestamp=_timestamp or datetime.now(),
             additional_data={
                 "organizational_analysis": organizational_analysis,
                 "technological_analysis": technological_analysis,
@@ -933,9 +1246,12 @@ class OCTAVERiskIdentification:
     
     def _analyze_octave_risk(self, org_analysis: Dict, tech_analysis: Dict) -> Dict:
         """OCTAVE Phase 3: Risk Analysis"""
-        # Combine organizational and technological perspectives
-        combined_threats = org_analysis.get("organizational_vulnerabilities", []) + \
-                          tech_analysis.get("technology_threats", [])
+        # Combine organizational and technological perspectives; the chain is
+        # materialized once, where assess_risk builds the result
+        combined_threats = chain(
+            org_analysis.get("organizational_vulnerabilities", ()),
+            tech_analysis.get("technology_threats", ())
+        )
         
         combined_vulnerabilities = tech_analysis.get("technical_vulnerabilities", [])
         
@@ -948,48 +1264,24 @@ class OCTAVERiskIdentification:
         risk_score = likelihood * impact
         
         # Risk level determination
-        if risk_score >= 0.7:
-            risk_level = "High"
-        elif risk_score >= 0.4:
-            risk_level = "Moderate"
-        else:
-            risk_level = "Low"
+        risk_level = _OCTAVE_RISK_LEVELS[bisect_right(_OCTAVE_RISK_THRESHOLDS, risk_score)]
         
         return {
-            "risk_score": round(risk_score, 3),
+            "risk_score": risk_score,
             "risk_level": risk_level,
-            "likelihood": round(likelihood, 3),
-            "impact": round(impact, 3),
+            "likelihood": likelihood,
+            "impact": impact,
             "threats": combined_threats,
             "vulnerabilities": combined_vulnerabilities
         }
     
     def _assess_business_impact(self, asset_context: Dict) -> float:
         """Assess business impact from organizational perspective"""
-        criticality_map = {
-            "low": 0.3,
-            "moderate": 0.5, 
-            "high": 0.8,
-            "critical": 1.0
-        }
-        
-        criticality = asset_context.get("criticality", "moderate").lower()
-        return criticality_map.get(criticality, 0.5)
+        return _business_impact_cached(asset_context.get("criticality", "moderate"))
     
     def _identify_org_vulnerabilities(self, asset_context: Dict) -> List[Dict]:
         """Identify organizational vulnerabilities"""
-        return [
-            {
-                "type": "organizational",
-                "name": "Inadequate Security Awareness",
-                "description": "Lack of security awareness among staff"
-            },
-            {
-                "type": "organizational", 
-                "name": "Insufficient Security Policies",
-                "description": "Inadequate or outdated security policies"
-            }
-        ]
+        return [dict(vulnerability) for vulnerability in _ORG_VULNERABILITIES]
     
     def _define_security_requirements(self, asset_context: Dict) -> List[str]:
         """Define security requirements based on asset characteristics"""
@@ -1043,46 +1335,68 @@ class OCTAVERiskIdentification:
     
     def _identify_technology_threats(self, asset_context: Dict) -> List[Dict]:
         """Identify technology-specific threats"""
-        return [
-            {
-                "threat_id": "OCTAVE-T1",
-                "name": "System Compromise",
-                "description": "Unauthorized access to system resources",
-                "likelihood": 0.6
-            },
-            {
-                "threat_id": "OCTAVE-T2", 
-                "name": "Data Corruption",
-                "description": "Intentional or accidental data corruption",
-                "likelihood": 0.3
-            }
-        ]
+        return [dict(threat) for threat in _TECHNOLOGY_THREATS]
     
-    def _generate_octave_recommendations(self, risk_analysis: Dict) -> List[str]:
+    def _generate_octave_recommendations(self, risk_analysis: Dict) -> Tuple[str, ...]:
         """Generate OCTAVE-based recommendations"""
-        risk_level = risk_analysis["risk_level"]
-        
-        base_recommendations = [
-            "Develop comprehensive security awareness program",
-            "Implement asset-centric security controls",
-            "Establish regular risk assessment procedures",
-            "Create incident response capabilities"
-        ]
-        
-        if risk_level == "High":
-            base_recommendations.extend([
-                "Immediate security control implementation",
-                "Enhanced monitoring and detection",
-                "Executive-level risk communication"
-            ])
-        elif risk_level == "Moderate":
-            base_recommendations.extend([
-                "Prioritized security improvements",
-                "Quarterly risk reviews",
-                "Staff security training"
-            ])
-        
-        return base_recommendations
+        return _OCTAVE_RECOMMENDATIONS.get(risk_analysis["risk_level"], _OCTAVE_BASE_RECOMMENDATIONS)
+
+
+# Methodologies applied when a caller does not choose
+_DEFAULT_METHODOLOGIES = (
+    RiskMethodology.ISO_27005,
+    RiskMethodology.NIST_SP_800_30,
+    RiskMethodology.OCTAVE
+)
+
+# Consensus level upper bounds (inclusive) on the std dev of methodology risk scores
+_CONSENSUS_LEVELS = ("High Consensus", "Moderate Consensus", "Low Consensus", "Significant Disagreement")
+_CONSENSUS_THRESHOLDS = (0.1, 0.2, 0.3)
+
+# Integration weights per methodology (prefer ISO 27005 if available)
+_INTEGRATION_WEIGHTS = {
+    "iso_27005": 0.4,
+    "nist_sp_800_30": 0.35,
+    "octave": 0.25
+}
+_WEIGHT_SUM = sum(_INTEGRATION_WEIGHTS.values())
+
+
+# Process-wide LRU cache of per-methodology results, keyed on the asset id,
+# methodologies and a digest of the full asset context. Entries are private
+# copies; every hit is deep-copied and re-stamped before use.
+_ASSESSMENT_CACHE: "OrderedDict[Tuple, Dict[str, StandardizedRiskResult]]" = OrderedDict()
+_ASSESSMENT_CACHE_SIZE = 4096
+_ASSESSMENT_CACHE_LOCK = Lock()
+
+
+def _assessment_cache_key(
+    asset_id: str,
+    asset_context: Dict,
+    methodologies_to_use: List[RiskMethodology]
+) -> Tuple:
+    """Cache key for the methodology results of unchanged inputs"""
+    context_digest = blake2b(
+        repr(sorted(asset_context.items())).encode(), digest_size=16
+    ).digest()
+    return asset_id, tuple(m.value for m in methodologies_to_use), context_digest
+
+
+def _restamped_results(
+    results: Dict[str, StandardizedRiskResult],
+    timestamp: datetime
+) -> Dict[str, StandardizedRiskResult]:
+    """Independent copies of methodology results, stamped with the given assessment time"""
+    return {
+        method_name: replace(result, assessment_timestamp=timestamp)
+        for method_name, result in deepcopy(results).items()
+    }
+
+
+def clear_assessment_cache() -> None:
+    """Drop all cached methodology results"""
+    with _ASSESSMENT_CACHE_LOCK:
+        _ASSESSMENT_CACHE.clear()
 
 
 class IntegratedRiskIdentification:
@@ -1115,12 +1429,124 @@ class IntegratedRiskIdentification:
         """
         
         if methodologies_to_use is None:
-            methodologies_to_use = [
-                RiskMethodology.ISO_27005,
-                RiskMethodology.NIST_SP_800_30,
-                RiskMethodology.OCTAVE
+            methodologies_to_use = list(_DEFAULT_METHODOLOGIES)
+        
+        # One timestamp for every methodology and the integrated result
+        timestamp = datetime.now()
+        
+        # Unchanged inputs give the same methodology results, so reuse cached ones;
+        # the integrated result and payload are always rebuilt for this call
+        cache_key = _assessment_cache_key(asset_id, asset_context, methodologies_to_use)
+        with _ASSESSMENT_CACHE_LOCK:
+            cached = _ASSESSMENT_CACHE.get(cache_key)
+            if cached is not None:
+                _ASSESSMENT_CACHE.move_to_end(cache_key)
+        
+        if cached is not None:
+            results = _restamped_results(cached, timestamp)
+        else:
+            results = self._run_methodologies(asset_id, asset_context, methodologies_to_use, timestamp)
+            with _ASSESSMENT_CACHE_LOCK:
+                _ASSESSMENT_CACHE[cache_key] = deepcopy(results)
+                if len(_ASSESSMENT_CACHE) > _ASSESSMENT_CACHE_SIZE:
+                    _ASSESSMENT_CACHE.popitem(last=False)
+        
+        # Generate integrated assessment
+        integrated_result = self._integrate_results(asset_id, results, asset_context, timestamp)
+        
+        return self._assessment_payload(
+            asset_id, results, integrated_result, methodologies_to_use, timestamp.isoformat()
+        )
+    
+    def batch_assessment(
+        self,
+        assets: List[Dict],
+        methodologies_to_use: List[RiskMethodology] = None
+    ) -> List[Dict]:
+        """
+        Perform comprehensive risk identification for many assets at once
+        
+        Each methodology still runs per asset, but the weighted fusion, risk
+        level bucketing and consensus calculation run as NumPy array
+        operations over the whole batch.
+        
+        Args:
+            assets: Asset contexts (see standardize_asset_context), each with an "asset_id"
+            methodologies_to_use: List of methodologies to apply
+            
+        Returns:
+            Comprehensive risk assessment results, in input order
+        """
+        
+        if methodologies_to_use is None:
+            methodologies_to_use = list(_DEFAULT_METHODOLOGIES)
+        
+        # One timestamp for the whole batch run
+        timestamp = datetime.now()
+        timestamp_iso = timestamp.isoformat()
+        
+        all_results = [
+            self._run_methodologies(asset_context.get("asset_id"), asset_context, methodologies_to_use, timestamp)
+            for asset_context in assets
+        ]
+        
+        if not all_results or not all_results[0]:
+            # Nothing to fuse - fall back to the per-asset path
+            return [
+                self.comprehensive_assessment(asset_context.get("asset_id"), asset_context, methodologies_to_use)
+                for asset_context in assets
+            ]
+        
+        # (assets, methodologies, [risk_score, likelihood, impact])
+        method_names = list(all_results[0])
+        metrics = np.array([
+            [(r.risk_score, r.likelihood, r.impact) for r in results.values()]
+            for results in all_results
+        ])
+        
+        # Weighted integration, normalised by the total weight
+        weights = np.array([
+            _INTEGRATION_WEIGHTS.get(name, 1.0 / len(method_names)) for name in method_names
+        ])
+        fused = (metrics * weights[None, :, None]).sum(axis=1) / weights.sum()
+        integrated_risk = fused[:, 0]
+        
+        risk_levels = [
+            _RISK_LEVELS[k]
+            for k in np.searchsorted(_INTEGRATED_RISK_THRESHOLDS, integrated_risk, side="right").tolist()
+        ]
+        
+        if len(method_names) < 2:
+            consensus_levels = ["Single Assessment"] * len(all_results)
+        else:
+            std_dev = metrics[:, :, 0].std(axis=1)
+            consensus_levels = [
+                _CONSENSUS_LEVELS[k]
+                for k in np.searchsorted(_CONSENSUS_THRESHOLDS, std_dev, side="left").tolist()
             ]
         
+        payloads = []
+        for asset_context, results, (risk, likelihood, impact), risk_level, consensus_level in zip(
+            assets, all_results, fused.tolist(), risk_levels, consensus_levels
+        ):
+            asset_id = asset_context.get("asset_id")
+            integrated_result = self._assemble_integrated_result(
+                asset_id, results, risk, likelihood, impact, risk_level, consensus_level, timestamp
+            )
+            payloads.append(self._assessment_payload(
+                asset_id, results, integrated_result, methodologies_to_use, timestamp_iso
+            ))
+        
+        return payloads
+    
+    def _run_methodologies(
+        self,
+        asset_id: str,
+        asset_context: Dict,
+        methodologies_to_use: List[RiskMethodology],
+        timestamp: datetime
+    ) -> Dict[str, StandardizedRiskResult]:
+        """Run each requested methodology for one asset, sharing one timestamp"""
         results = {}
         
         # ISO 27005 Assessment (existing implementation)
@@ -1131,46 +1557,47 @@ class IntegratedRiskIdentification:
                 integrity=asset_context.get("integrity", 0.5),
                 availability=asset_context.get("availability", 0.5),
                 classification_value=asset_context.get("classification_value", 0.5),
-                organizational_context=asset_context
+                organizational_context=asset_context,
+                _timestamp=timestamp
             )
             results["iso_27005"] = self._convert_iso_result(iso_result)
         
         # NIST SP 800-30 Assessment
         if RiskMethodology.NIST_SP_800_30 in methodologies_to_use:
-            results["nist_sp_800_30"] = self.nist.assess_risk(asset_id, asset_context)
+            results["nist_sp_800_30"] = self.nist.assess_risk(asset_id, asset_context, _timestamp=timestamp)
         
         # OCTAVE Assessment
         if RiskMethodology.OCTAVE in methodologies_to_use:
-            results["octave"] = self.octave.assess_risk(asset_id, asset_context)
-        
-        # Generate integrated assessment
-        integrated_result = self._integrate_results(asset_id, results, asset_context)
+            results["octave"] = self.octave.assess_risk(asset_id, asset_context, _timestamp=timestamp)
         
+        return results
+    
+    def _assessment_payload(
+        self,
+        asset_id: str,
+        results: Dict[str, StandardizedRiskResult],
+        integrated_result: StandardizedRiskResult,
+        methodologies_to_use: List[RiskMethodology],
+        timestamp_iso: str
+    ) -> Dict:
+        """Assemble the comprehensive assessment response for one asset"""
         return {
             "asset_id": asset_id,
             "individual_assessments": results,
             "integrated_assessment": integrated_result,
             "methodologies_used": [m.value for m in methodologies_to_use],
-            "assessment_timestamp": datetime.now().isoformat(),
+            "assessment_timestamp": timestamp_iso,
             "compliance_status": self._check_compliance_status(results)
         }
     
     def _convert_iso_result(self, iso_result: RiskIdentificationResult) -> StandardizedRiskResult:
         """Convert ISO 27005 result to standardized format"""
-        # Convert risk index to risk level
-        risk_level_map = {
-            (0.0, 0.25): "Very Low",
-            (0.25, 0.5): "Low", 
-            (0.5, 0.75): "Moderate",
-            (0.75, 0.9): "High",
-            (0.9, 1.0): "Very High"
-        }
-        
-        risk_level = "Moderate"
-        for (low, high), level in risk_level_map.items():
-            if low <= iso_result.risk_index < high:
-                risk_level = level
-                break
+        # Convert risk index to risk level (indices outside [0, 1) stay Moderate)
+        risk_index = iso_result.risk_index
+        if 0.0 <= risk_index < 1.0:
+            risk_level = _RISK_LEVELS[bisect_right(_ISO_RISK_THRESHOLDS, risk_index)]
+        else:
+            risk_level = "Moderate"
         
         return StandardizedRiskResult(
             asset_id=iso_result.asset_id,
@@ -1209,9 +1636,11 @@ class IntegratedRiskIdentification:
         self, 
         asset_id: str, 
         results: Dict[str, StandardizedRiskResult], 
-        asset_context: Dict
+        asset_context: Dict,
+        _timestamp: datetime = None
     ) -> StandardizedRiskResult:
         """Integrate results from multiple methodologies"""
+        timestamp = _timestamp or datetime.now()
         
         if not results:
             # Fallback to basic assessment
@@ -1226,105 +1655,126 @@ class IntegratedRiskIdentification:
                 vulnerabilities_identified=[],
                 recommendations=["No assessment results available"],
                 compliance_frameworks=[],
-                assessment_timestamp=datetime.now(),
+                assessment_timestamp=timestamp,
                 additional_data={}
             )
         
-        # Calculate weighted average risk scores
-        risk_scores = [r.risk_score for r in results.values()]
-        likelihoods = [r.likelihood for r in results.values()]
-        impacts = [r.impact for r in results.values()]
-        
-        # Weighted integration (prefer ISO 27005 if available)
-        weights = {
-            "iso_27005": 0.4,
-            "nist_sp_800_30": 0.35,
-            "octave": 0.25
-        }
+        # Weighted integration (prefer ISO 27005 if available), accumulated in
+        # one pass together with the plain sums and Welford's running
+        # mean/variance of the risk scores for the consensus level
+        weights = _INTEGRATION_WEIGHTS
+        default_weight = 1.0 / len(results)
         
         weighted_risk = 0.0
         weighted_likelihood = 0.0
         weighted_impact = 0.0
-        total_weight = 0.0
+        likelihood_sum = 0.0
+        impact_sum = 0.0
+        count = 0
+        mean_risk = 0.0
+        risk_m2 = 0.0
         
         for method_name, result in results.items():
-            weight = weights.get(method_name, 1.0 / len(results))
-            weighted_risk += result.risk_score * weight
+            risk_score = result.risk_score
+            weight = weights.get(method_name, default_weight)
+            weighted_risk += risk_score * weight
             weighted_likelihood += result.likelihood * weight
             weighted_impact += result.impact * weight
-            total_weight += weight
+            likelihood_sum += result.likelihood
+            impact_sum += result.impact
+            
+            count += 1
+            delta = risk_score - mean_risk
+            mean_risk += delta / count
+            risk_m2 += delta * (risk_score - mean_risk)
+        
+        # Normalize if needed; the full methodology set carries the
+        # precomputed weight sum, so only partial or unknown sets are summed
+        if results.keys() == weights.keys():
+            total_weight = _WEIGHT_SUM
+        else:
+            total_weight = sum(weights.get(method_name, default_weight) for method_name in results)
         
-        # Normalize if needed
-        if total_weight > 0:
+        if total_weight == 1.0:
+            integrated_risk = weighted_risk
+            integrated_likelihood = weighted_likelihood
+            integrated_impact = weighted_impact
+        elif total_weight > 0:
             integrated_risk = weighted_risk / total_weight
             integrated_likelihood = weighted_likelihood / total_weight
             integrated_impact = weighted_impact / total_weight
         else:
-            integrated_risk = sum(risk_scores) / len(risk_scores)
-            integrated_likelihood = sum(likelihoods) / len(likelihoods)
-            integrated_impact = sum(impacts) / len(impacts)
+            integrated_risk = mean_risk
+            integrated_likelihood = likelihood_sum / count
+            integrated_impact = impact_sum / count
         
         # Determine integrated risk level
-        if integrated_risk >= 0.8:
-            risk_level = "Very High"
-        elif integrated_risk >= 0.6:
-            risk_level = "High"
-        elif integrated_risk >= 0.4:
-            risk_level = "Moderate"
-        elif integrated_risk >= 0.2:
-            risk_level = "Low"
-        else:
-            risk_level = "Very Low"
+        risk_level = _RISK_LEVELS[bisect_right(_INTEGRATED_RISK_THRESHOLDS, integrated_risk)]
         
+        return self._assemble_integrated_result(
+            asset_id, results, integrated_risk, integrated_likelihood, integrated_impact,
+            risk_level, self._consensus_level(count, math.sqrt(risk_m2 / count)), timestamp
+        )
+    
+    def _assemble_integrated_result(
+        self,
+        asset_id: str,
+        results: Dict[str, StandardizedRiskResult],
+        integrated_risk: float,
+        integrated_likelihood: float,
+        integrated_impact: float,
+        risk_level: str,
+        consensus_level: str,
+        timestamp: datetime
+    ) -> StandardizedRiskResult:
+        """Build the integrated result from fused metrics and the merged findings"""
         # Combine threats and vulnerabilities
+        risk_scores = []
         all_threats = []
         all_vulnerabilities = []
         all_recommendations = []
         all_frameworks = []
         
         for result in results.values():
+            risk_scores.append(result.risk_score)
             all_threats.extend(result.threats_identified)
             all_vulnerabilities.extend(result.vulnerabilities_identified)
             all_recommendations.extend(result.recommendations)
             all_frameworks.extend(result.compliance_frameworks)
         
-        # Remove duplicates while preserving order
-        unique_threats = []
-        seen_threat_ids = set()
+        # Remove duplicates while preserving order (first occurrence wins)
+        threats_by_id = {}
         for threat in all_threats:
-            threat_id = threat.get("threat_id") or threat.get("name")
-            if threat_id not in seen_threat_ids:
-                unique_threats.append(threat)
-                seen_threat_ids.add(threat_id)
+            threats_by_id.setdefault(threat.get("threat_id") or threat.get("name"), threat)
+        unique_threats = list(threats_by_id.values())
         
-        unique_vulnerabilities = []
-        seen_vuln_names = set()
+        vulnerabilities_by_name = {}
         for vuln in all_vulnerabilities:
             vuln_name = vuln.get("name", "")
-            if vuln_name and vuln_name not in seen_vuln_names:
-                unique_vulnerabilities.append(vuln)
-                seen_vuln_names.add(vuln_name)
+            if vuln_name:
+                vulnerabilities_by_name.setdefault(vuln_name, vuln)
+        unique_vulnerabilities = list(vulnerabilities_by_name.values())
         
-        unique_recommendations = list(set(all_recommendations))
-        unique_frameworks = list(set(all_frameworks))
+        unique_recommendations = list(dict.fromkeys(all_recommendations))
+        unique_frameworks = list(dict.fromkeys(all_frameworks))
         
         return StandardizedRiskResult(
             asset_id=asset_id,
             methodology=RiskMethodology.INTEGRATED,
-            risk_score=round(integrated_risk, 3),
+            risk_score=integrated_risk,
             risk_level=risk_level,
-            likelihood=round(integrated_likelihood, 3),
-            impact=round(integrated_impact, 3),
+            likelihood=integrated_likelihood,
+            impact=integrated_impact,
             threats_identified=unique_threats,
             vulnerabilities_identified=unique_vulnerabilities,
             recommendations=self._generate_integrated_recommendations(risk_level, unique_recommendations),
             compliance_frameworks=unique_frameworks,
-            assessment_timestamp=datetime.now(),
+            assessment_timestamp=timestamp,
             additional_data={
-                "integration_weights": weights,
+                "integration_weights": dict(_INTEGRATION_WEIGHTS),
                 "methodologies_count": len(results),
                 "risk_score_range": f"{min(risk_scores):.3f} - {max(risk_scores):.3f}",
-                "consensus_level": self._calculate_consensus_level(risk_scores)
+                "consensus_level": consensus_level
             }
         )
     
@@ -1363,30 +1813,17 @@ class IntegratedRiskIdentification:
             ])
         
         # Add unique recommendations from individual assessments
-        prioritized_recommendations = list(set(existing_recommendations))[:5]
+        prioritized_recommendations = list(islice(dict.fromkeys(existing_recommendations), 5))
         integrated_recommendations.extend(prioritized_recommendations)
         
         return integrated_recommendations
     
-    def _calculate_consensus_level(self, risk_scores: List[float]) -> str:
-        """Calculate consensus level between different methodologies"""
-        if not risk_scores or len(risk_scores) < 2:
+    def _consensus_level(self, count: int, std_dev: float) -> str:
+        """Consensus level from the spread (standard deviation) of methodology risk scores"""
+        if count < 2:
             return "Single Assessment"
         
-        # Calculate standard deviation
-        mean_score = sum(risk_scores) / len(risk_scores)
-        variance = sum((score - mean_score) ** 2 for score in risk_scores) / len(risk_scores)
-        std_dev = variance ** 0.5
-        
-        # Determine consensus level
-        if std_dev <= 0.1:
-            return "High Consensus"
-        elif std_dev <= 0.2:
-            return "Moderate Consensus"
-        elif std_dev <= 0.3:
-            return "Low Consensus"
-        else:
-            return "Significant Disagreement"
+        return _CONSENSUS_LEVELS[bisect_left(_CONSENSUS_THRESHOLDS, std_dev)]
     
     def _check_compliance_status(self, results: Dict[str, StandardizedRiskResult]) -> Dict:
         """Check compliance status across all frameworks"""
@@ -1426,16 +1863,10 @@ def standardize_asset_context(asset_data: Dict) -> Dict:
         Standardized asset context
     """
     
-    # Map business_criticality to criticality level
+    # Map business_criticality to criticality level; always one of the
+    # lowercase _CRITICALITY_LEVELS tokens the methodologies look up directly
     business_criticality = asset_data.get("business_criticality", 0.5)
-    if business_criticality >= 0.8:
-        criticality_level = "critical"
-    elif business_criticality >= 0.6:
-        criticality_level = "high"
-    elif business_criticality >= 0.4:
-        criticality_level = "moderate"
-    else:
-        criticality_level = "low"
+    criticality_level = _CRITICALITY_LEVELS[bisect_right(_CRITICALITY_THRESHOLDS, business_criticality)]
     
     return {
         "asset_id": asset_data.get("id"),
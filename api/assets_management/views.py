@@ -5,7 +5,6 @@ This module defines RESTful API endpoints for the cloud asset classification sys
 replacing the GraphQL implementation with standard REST endpoints.
 """
 
-from datetime import datetime
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -13,10 +12,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
+from django.core.cache import cache
 from django.db import transaction
 import logging
+import numpy as np
 from django.utils import timezone
-from typing import List
+from types import MappingProxyType
+from typing import Tuple
 
 from .models import (
     AssetListing,
@@ -50,19 +52,23 @@ from .serializers import (
     RiskAnalysisRequestSerializer,
     ModelComparisonRequestSerializer,
     BatchComparisonRequestSerializer,
+    BatchClassificationRequestSerializer,
     AssetClassificationResponseSerializer,
-    RiskIdentificationResponseSerializer,
-    RiskAnalysisResponseSerializer,
     ModelComparisonResponseSerializer,
     BatchComparisonResponseSerializer,
     PerformanceMetricsSerializer
 )
 
 # Import our utility functions
-from .utils.classification import classify_asset, validate_classification_standards_compliance
+from .signals import PERFORMANCE_METRICS_CACHE_KEY, PERFORMANCE_METRICS_CACHE_TIMEOUT
+from .utils.classification import (
+    classify_asset,
+    classify_asset_ensemble,
+    validate_classification_standards_compliance
+)
 from .utils.compute_risk_level import compute_risk_level
 from .utils.risk_analysis import calculate_risk_level
-from .utils.model_comparison import ModelComparisonFramework
+from .utils.model_comparison import get_comparison_framework
 from .utils.risk_identification import (
     IntegratedRiskIdentification, 
     RiskMethodology, 
@@ -71,6 +77,252 @@ from .utils.risk_identification import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+# AssetListing fields written back by classify_asset, classify_asset_ensemble and classify_batch
+_CLASSIFICATION_UPDATE_FIELDS = (
+    'classification_value',
+    'classification',
+    'business_criticality',
+    'data_sensitivity',
+    'operational_dependency',
+    'regulatory_impact',
+    'last_analysis_date',
+    'updated_at',
+)
+
+# AssetListing fields read by classify_batch
+_CLASSIFICATION_INPUT_FIELDS = (
+    'id',
+    'operational_dependency',
+    'data_sensitivity',
+    'business_criticality',
+    'regulatory_impact',
+    'confidentiality',
+    'integrity',
+    'availability',
+)
+
+
+def _missing_classification_params(asset_importance, data_value, business_criticality, replaceability):
+    """Names of the classification parameters that have no value"""
+    params = (
+        ('asset_importance (operational_dependency)', asset_importance),
+        ('data_value (data_sensitivity)', data_value),
+        ('business_criticality', business_criticality),
+        ('replaceability (regulatory_impact)', replaceability),
+    )
+    return [name for name, value in params if value is None]
+
+
+def _first_outside_unit_range(values):
+    """Name of the first value that is not a number in the 0-1 range, or None"""
+    for name, value in values.items():
+        if not isinstance(value, (int, float)) or not (0 <= value <= 1):
+            return name
+    return None
+
+
+def _read_classification_inputs(asset, data, note):
+    """
+    Read the classification inputs from the request, falling back to the asset's stored values
+    
+    Missing inputs take conservative defaults, unless three or more are missing.
+    
+    Returns:
+        tuple: (asset_importance, data_value, business_criticality, replaceability) and an
+        error Response, exactly one of which is None
+    """
+    asset_importance = data.get('asset_importance', asset.operational_dependency)
+    data_value = data.get('data_value', asset.data_sensitivity)
+    business_criticality = data.get('business_criticality', asset.business_criticality)
+    replaceability = data.get('replaceability', asset.regulatory_impact)
+    
+    # If too many parameters are missing, suggest manual classification
+    null_params = _missing_classification_params(
+        asset_importance, data_value, business_criticality, replaceability
+    )
+    if len(null_params) >= 3:
+        return None, Response({
+            'error': 'Insufficient classification parameters for automatic classification',
+            'missing_parameters': null_params,
+            'suggestion': 'Please use the Asset Classification page for manual parameter setting',
+            'manual_classification_url': f'/classification/asset-classify?id={asset.id}',
+            'note': note
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Validate inputs are in 0-1 range (conservative defaults fill the gaps)
+    inputs = {
+        'asset_importance': asset_importance or 0.3,
+        'data_value': data_value or 0.4,
+        'business_criticality': business_criticality or 0.5,
+        'replaceability': replaceability or 0.4
+    }
+    
+    invalid_field = _first_outside_unit_range(inputs)
+    if invalid_field is not None:
+        return None, Response(
+            {'error': f'{invalid_field} must be a number between 0.0 and 1.0'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    return tuple(inputs.values()), None
+
+
+def _apply_ensemble_classification(asset, asset_importance, data_value, business_criticality, replaceability, analysis_date):
+    """
+    Run ensemble classification for an asset and set the classification fields (without saving)
+    
+    Missing parameters take the conservative defaults used by classify_asset.
+    
+    Returns:
+        dict: Ensemble classification result
+    """
+    asset_importance = asset_importance or 0.3
+    data_value = data_value or 0.4
+    business_criticality = business_criticality or 0.5
+    replaceability = replaceability or 0.4
+    
+    result = classify_asset_ensemble(
+        business_criticality=business_criticality,
+        data_sensitivity=data_value,
+        operational_dependency=asset_importance,
+        regulatory_impact=replaceability,
+        confidentiality=asset.confidentiality or 0.5,
+        integrity=asset.integrity or 0.5,
+        availability=asset.availability or 0.5,
+        use_ml_models=True  # Enable ML models in ensemble
+    )
+    
+    asset.classification_value = result['classification_score']
+    asset.classification = f"{result['classification_category']} ({result['classification_score']:.2f})"
+    asset.business_criticality = business_criticality
+    asset.data_sensitivity = data_value
+    asset.operational_dependency = asset_importance
+    asset.regulatory_impact = replaceability
+    asset.last_analysis_date = analysis_date
+    return result
+
+
+# AssetListing fields read by batch_compare as model inputs
+_BATCH_COMPARE_INPUT_FIELDS = (
+    'id',
+    'business_criticality',
+    'data_sensitivity',
+    'operational_dependency',
+    'regulatory_impact',
+    'confidentiality',
+    'integrity',
+    'availability',
+    'classification_value',
+)
+
+# AssetListing fields written back by compare_models and batch_compare
+_COMPARISON_UPDATE_FIELDS = (
+    'traditional_fuzzy_prediction',
+    'modern_svm_prediction',
+    'modern_dt_prediction',
+    'traditional_fuzzy_score',
+    'modern_svm_score',
+    'modern_dt_score',
+    'mathematical_risk_category',
+    'comparison_performed_date',
+    'updated_at',
+)
+
+# Request names of the identify_risk_enhanced methodologies
+_METHODOLOGIES_BY_NAME = MappingProxyType({
+    'iso_27005': RiskMethodology.ISO_27005,
+    'nist_sp_800_30': RiskMethodology.NIST_SP_800_30,
+    'octave': RiskMethodology.OCTAVE,
+    'integrated': RiskMethodology.INTEGRATED
+})
+
+# Next steps per identified risk level. Shared tuples, so callers must not mutate them.
+_NEXT_STEPS = MappingProxyType({
+    'Very High': (
+        'Proceed immediately to Risk Analysis phase',
+        'Consider implementing emergency controls',
+        'Escalate to executive management',
+        'Document risk treatment decisions'
+    ),
+    'High': (
+        'Proceed to Risk Analysis phase within 24-48 hours',
+        'Review and prioritize security controls',
+        'Engage risk management team',
+        'Prepare risk treatment plan'
+    ),
+    'Moderate': (
+        'Schedule Risk Analysis phase within 1 week',
+        'Review existing security controls',
+        'Consider risk mitigation options',
+        'Update risk register'
+    ),
+    'Low': (
+        'Proceed with routine Risk Analysis phase',
+        'Maintain current security posture',
+        'Schedule periodic risk review',
+        'Document findings'
+    ),
+    'Very Low': (
+        'Complete Risk Analysis phase as planned',
+        'Continue standard monitoring',
+        'Annual risk assessment sufficient'
+    )
+})
+
+_MODERATE_NEXT_STEPS = _NEXT_STEPS['Moderate']
+
+# Static payload of the risk_identification_methodologies action
+_RISK_METHODOLOGIES = {
+    'iso_27005': {
+        'name': 'ISO 27005:2022',
+        'description': 'Information security risk management standard',
+        'approaches': ['Asset-based', 'Event-based', 'Hybrid'],
+        'compliance_frameworks': ['ISO 27001', 'ISO 27005:2022'],
+        'best_for': 'Comprehensive information security risk management',
+        'implementation_status': 'Fully Implemented'
+    },
+    'nist_sp_800_30': {
+        'name': 'NIST SP 800-30 Rev 1',
+        'description': 'Guide for Conducting Risk Assessments',
+        'approaches': ['Three-tiered assessment', 'Threat source analysis'],
+        'compliance_frameworks': ['NIST Cybersecurity Framework', 'NIST SP 800-30'],
+        'best_for': 'Federal and enterprise risk assessments',
+        'implementation_status': 'Fully Implemented'
+    },
+    'octave': {
+        'name': 'OCTAVE',
+        'description': 'Operationally Critical Threat, Asset, and Vulnerability Evaluation',
+        'approaches': ['Organizational view', 'Technological view', 'Risk analysis'],
+        'compliance_frameworks': ['Asset-Centric Risk Management'],
+        'best_for': 'Operational risk assessment with business focus',
+        'implementation_status': 'Fully Implemented'
+    },
+    'integrated': {
+        'name': 'Integrated Multi-Framework Approach',
+        'description': 'Combines multiple methodologies for comprehensive assessment',
+        'approaches': ['ISO 27005', 'NIST SP 800-30', 'OCTAVE'],
+        'compliance_frameworks': ['Multiple standards compliance'],
+        'best_for': 'Comprehensive risk identification with multiple perspectives',
+        'implementation_status': 'Fully Implemented'
+    }
+}
+
+_RISK_METHODOLOGIES_RESPONSE = {
+    'available_methodologies': _RISK_METHODOLOGIES,
+    'default_methodology': 'integrated',
+    'recommended_combination': ['iso_27005', 'nist_sp_800_30', 'octave'],
+    'implementation_guide': {
+        'step_1': 'Select appropriate methodology based on organizational needs',
+        'step_2': 'Assess CIA triad (Confidentiality, Integrity, Availability)',
+        'step_3': 'Execute risk identification using selected methodology',
+        'step_4': 'Review results and proceed to Risk Analysis phase'
+    }
+}
+
+
 class DepartmentViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing departments
@@ -109,7 +361,7 @@ class AssetListingViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing asset listings with classification and risk analysis
     """
-    queryset = AssetListing.objects.all().select_related('owner_department')
+    queryset = AssetListing.objects.all()
     parser_classes = (JSONParser, MultiPartParser, FormParser)
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = [
@@ -120,6 +372,30 @@ class AssetListingViewSet(viewsets.ModelViewSet):
     search_fields = ['asset', 'description']
     ordering_fields = ['created_at', 'updated_at', 'classification_value', 'risk_index']
     ordering = ['-created_at']
+    
+    # Query parameters handled by the filter backends
+    _FILTER_PARAMS = frozenset([*filterset_fields, 'search', 'ordering'])
+
+    def filter_queryset(self, queryset):
+        """Skip the filter backends when no filter parameter is given, keeping the default ordering"""
+        if self._FILTER_PARAMS.isdisjoint(self.request.query_params):
+            return queryset.order_by(*self.ordering)
+        return super().filter_queryset(queryset)
+
+    # Actions that read the owner department's name, either via the serializer or directly
+    _DEPARTMENT_ACTIONS = frozenset(['list', 'retrieve', 'update', 'partial_update', 'identify_risk_enhanced'])
+
+    # Read-compute-write actions; each runs in a transaction holding the asset's row lock
+    _LOCKING_ACTIONS = frozenset(['classify_asset', 'classify_asset_ensemble', 'identify_risk', 'identify_risk_enhanced'])
+
+    def get_queryset(self):
+        """Join the owner department only for actions that read it, and lock the row for write actions"""
+        queryset = super().get_queryset()
+        if self.action in self._DEPARTMENT_ACTIONS:
+            queryset = queryset.select_related('owner_department')
+        if self.action in self._LOCKING_ACTIONS:
+            queryset = queryset.select_for_update(of=('self',))
+        return queryset
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -128,6 +404,7 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         return AssetListingSerializer
 
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def classify_asset(self, request, pk=None):
         """
         Phase 2: Asset Classification using fuzzy logic (0-1 scale)
@@ -135,85 +412,22 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         """
         try:
             asset = self.get_object()
-            data = request.data
-            
-            # Get classification inputs from request or use existing asset values
-            asset_importance = data.get('asset_importance', asset.operational_dependency)
-            data_value = data.get('data_value', asset.data_sensitivity)
-            business_criticality = data.get('business_criticality', asset.business_criticality)
-            replaceability = data.get('replaceability', asset.regulatory_impact)
-            
-            # Check if we have meaningful classification parameters
-            null_params = []
-            if asset_importance is None:
-                null_params.append('asset_importance (operational_dependency)')
-            if data_value is None:
-                null_params.append('data_value (data_sensitivity)')
-            if business_criticality is None:
-                null_params.append('business_criticality')
-            if replaceability is None:
-                null_params.append('replaceability (regulatory_impact)')
-            
-            # If too many parameters are missing, suggest manual classification
-            if len(null_params) >= 3:
-                return Response({
-                    'error': 'Insufficient classification parameters for automatic classification',
-                    'missing_parameters': null_params,
-                    'suggestion': 'Please use the Asset Classification page for manual parameter setting',
-                    'manual_classification_url': f'/classification/asset-classify?id={asset.id}',
-                    'note': 'Quick classification requires at least 2 pre-existing parameters to avoid generic results'
-                }, status=status.HTTP_400_BAD_REQUEST)
             
-            # Apply conservative defaults only if we have some parameters
-            asset_importance = asset_importance or 0.3
-            data_value = data_value or 0.4  
-            business_criticality = business_criticality or 0.5
-            replaceability = replaceability or 0.4
-            
-            # Validate inputs are in 0-1 range
-            inputs = {
-                'asset_importance': asset_importance,
-                'data_value': data_value,
-                'business_criticality': business_criticality,
-                'replaceability': replaceability
-            }
-            
-            for field, value in inputs.items():
-                if not isinstance(value, (int, float)) or not (0 <= value <= 1):
-                    return Response(
-                        {'error': f'{field} must be a number between 0.0 and 1.0'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
+            classification_inputs, error_response = _read_classification_inputs(
+                asset, request.data,
+                'Quick classification requires at least 2 pre-existing parameters to avoid generic results'
+            )
+            if error_response is not None:
+                return error_response
             
             # Perform ensemble classification using fuzzy logic + ML models
-            from .utils.classification import classify_asset_ensemble
-            
-            result = classify_asset_ensemble(
-                business_criticality=business_criticality,
-                data_sensitivity=data_value,
-                operational_dependency=asset_importance,
-                regulatory_impact=replaceability,
-                confidentiality=asset.confidentiality or 0.5,
-                integrity=asset.integrity or 0.5,
-                availability=asset.availability or 0.5,
-                use_ml_models=True  # Enable ML models in ensemble
-            )
+            result = _apply_ensemble_classification(asset, *classification_inputs, timezone.now())
             
             # Log classification for audit trail
-            logger = logging.getLogger(__name__)
-            logger.info(f"Asset {asset.id} classified: "
-                       f"score={result['classification_score']}, "
-                       f"category={result['classification_category']}")
-            
-            # Update asset with classification results and inputs
-            asset.classification_value = result['classification_score']
-            asset.classification = f"{result['classification_category']} ({result['classification_score']:.2f})"
-            asset.business_criticality = business_criticality
-            asset.data_sensitivity = data_value
-            asset.operational_dependency = asset_importance
-            asset.regulatory_impact = replaceability
-            asset.last_analysis_date = datetime.now()
-            asset.save()
+            logger.info("Asset %s classified: score=%s, category=%s",
+                        asset.id, result['classification_score'], result['classification_category'])
+            
+            asset.save(update_fields=_CLASSIFICATION_UPDATE_FIELDS)
             
             # Prepare response
             response_data = {
@@ -238,14 +452,96 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             return Response(response_data, status=status.HTTP_200_OK)
             
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Classification failed for asset {pk}: {str(e)}")
+            logger.error("Classification failed for asset %s: %s", pk, e)
             return Response(
                 {'error': f'Classification failed: {str(e)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    @action(detail=False, methods=['post'])
+    @transaction.atomic
+    def classify_batch(self, request):
+        """
+        Batch Phase 2 classification from each asset's stored parameters
+        POST /api/assets/classify_batch/
+        Body: {"asset_ids": [...]}
+        """
+        try:
+            serializer = BatchClassificationRequestSerializer(data=request.data)
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            
+            asset_ids = serializer.validated_data['asset_ids']
+            
+            # Load and lock all requested assets in one query, like the single-asset
+            # classify actions; rows are locked in id order so batches cannot deadlock
+            asset_map = {
+                asset.id: asset
+                for asset in AssetListing.objects.filter(id__in=asset_ids).only(
+                    *_CLASSIFICATION_INPUT_FIELDS, *_CLASSIFICATION_UPDATE_FIELDS
+                ).select_for_update(of=('self',)).order_by('id')
+            }
+            
+            analysis_date = timezone.now()
+            classified_assets = []
+            results = []
+            for asset_id in dict.fromkeys(asset_ids):
+                asset = asset_map.get(asset_id)
+                if asset is None:
+                    results.append({'asset_id': str(asset_id), 'error': 'Asset with this ID does not exist.'})
+                    continue
+                
+                params = (
+                    asset.operational_dependency,
+                    asset.data_sensitivity,
+                    asset.business_criticality,
+                    asset.regulatory_impact
+                )
+                null_params = _missing_classification_params(*params)
+                if len(null_params) >= 3:
+                    results.append({
+                        'asset_id': str(asset_id),
+                        'error': 'Insufficient classification parameters for automatic classification',
+                        'missing_parameters': null_params
+                    })
+                    continue
+                
+                try:
+                    result = _apply_ensemble_classification(asset, *params, analysis_date)
+                except Exception as e:
+                    results.append({'asset_id': str(asset_id), 'error': f'Classification failed: {str(e)}'})
+                    continue
+                
+                asset.updated_at = analysis_date
+                classified_assets.append(asset)
+                results.append({
+                    'asset_id': str(asset_id),
+                    'classification_value': asset.classification_value,
+                    'classification': asset.classification,
+                    'classification_result': result
+                })
+            
+            AssetListing.objects.bulk_update(classified_assets, _CLASSIFICATION_UPDATE_FIELDS, batch_size=500)
+            
+            return Response({
+                'batch_size': len(results),
+                'timestamp': analysis_date,
+                'results': results,
+                'summary': {
+                    'completed': len(classified_assets),
+                    'errors': len(results) - len(classified_assets)
+                }
+            }, status=status.HTTP_200_OK)
+            
+        except Exception as e:
+            logger.error("Batch classification failed: %s", e)
+            return Response(
+                {'error': f'Batch classification failed: {str(e)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def classify_asset_ensemble(self, request, pk=None):
         """
         Enhanced Phase 2: Asset Classification using Ensemble (Fuzzy Logic + ML Models)
@@ -253,86 +549,23 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         """
         try:
             asset = self.get_object()
-            data = request.data
-            
-            # Get classification inputs from request or use existing asset values
-            asset_importance = data.get('asset_importance', asset.operational_dependency)
-            data_value = data.get('data_value', asset.data_sensitivity)
-            business_criticality = data.get('business_criticality', asset.business_criticality)
-            replaceability = data.get('replaceability', asset.regulatory_impact)
-            
-            # Check if we have meaningful classification parameters
-            null_params = []
-            if asset_importance is None:
-                null_params.append('asset_importance (operational_dependency)')
-            if data_value is None:
-                null_params.append('data_value (data_sensitivity)')
-            if business_criticality is None:
-                null_params.append('business_criticality')
-            if replaceability is None:
-                null_params.append('replaceability (regulatory_impact)')
-            
-            # If too many parameters are missing, suggest manual classification
-            if len(null_params) >= 3:
-                return Response({
-                    'error': 'Insufficient classification parameters for automatic classification',
-                    'missing_parameters': null_params,
-                    'suggestion': 'Please use the Asset Classification page for manual parameter setting',
-                    'manual_classification_url': f'/classification/asset-classify?id={asset.id}',
-                    'note': 'Ensemble classification requires at least 2 pre-existing parameters to avoid generic results'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Apply conservative defaults only if we have some parameters
-            asset_importance = asset_importance or 0.3
-            data_value = data_value or 0.4  
-            business_criticality = business_criticality or 0.5
-            replaceability = replaceability or 0.4
-            
-            # Validate inputs are in 0-1 range
-            inputs = {
-                'asset_importance': asset_importance,
-                'data_value': data_value,
-                'business_criticality': business_criticality,
-                'replaceability': replaceability
-            }
             
-            for field, value in inputs.items():
-                if not isinstance(value, (int, float)) or not (0 <= value <= 1):
-                    return Response(
-                        {'error': f'{field} must be a number between 0.0 and 1.0'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
+            classification_inputs, error_response = _read_classification_inputs(
+                asset, request.data,
+                'Ensemble classification requires at least 2 pre-existing parameters to avoid generic results'
+            )
+            if error_response is not None:
+                return error_response
             
             # Perform ensemble classification using fuzzy logic + ML models
-            from .utils.classification import classify_asset_ensemble
-            
-            result = classify_asset_ensemble(
-                business_criticality=business_criticality,
-                data_sensitivity=data_value,
-                operational_dependency=asset_importance,
-                regulatory_impact=replaceability,
-                confidentiality=asset.confidentiality or 0.5,
-                integrity=asset.integrity or 0.5,
-                availability=asset.availability or 0.5,
-                use_ml_models=True  # Enable ML models in ensemble
-            )
+            result = _apply_ensemble_classification(asset, *classification_inputs, timezone.now())
             
             # Log classification for audit trail
-            logger = logging.getLogger(__name__)
-            logger.info(f"Asset {asset.id} ensemble classified: "
-                       f"score={result['classification_score']}, "
-                       f"category={result['classification_category']}, "
-                       f"confidence={result.get('ensemble_confidence', 'N/A')}")
-            
-            # Update asset with classification results and inputs
-            asset.classification_value = result['classification_score']
-            asset.classification = f"{result['classification_category']} ({result['classification_score']:.2f})"
-            asset.business_criticality = business_criticality
-            asset.data_sensitivity = data_value
-            asset.operational_dependency = asset_importance
-            asset.regulatory_impact = replaceability
-            asset.last_analysis_date = datetime.now()
-            asset.save()
+            logger.info("Asset %s ensemble classified: score=%s, category=%s, confidence=%s",
+                        asset.id, result['classification_score'], result['classification_category'],
+                        result.get('ensemble_confidence', 'N/A'))
+            
+            asset.save(update_fields=_CLASSIFICATION_UPDATE_FIELDS)
             
             # Prepare response
             response_data = {
@@ -359,14 +592,14 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             return Response(response_data, status=status.HTTP_200_OK)
             
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Ensemble classification failed for asset {pk}: {str(e)}")
+            logger.error("Ensemble classification failed for asset %s: %s", pk, e)
             return Response(
                 {'error': f'Ensemble classification failed: {str(e)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def identify_risk(self, request, pk=None):
         """
         Phase 2: Identify risk using CIA triad assessment
@@ -375,10 +608,7 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         """
         try:
             asset = self.get_object()
-            serializer = RiskIdentificationRequestSerializer(data={
-                'asset_id': asset.id,
-                **request.data
-            })
+            serializer = RiskIdentificationRequestSerializer(data=request.data, context={'asset': asset})
             
             if not serializer.is_valid():
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -405,8 +635,8 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             asset.integrity = integrity
             asset.availability = availability
             asset.risk_index = risk_index
-            asset.last_analysis_date = datetime.now()
-            asset.save()
+            asset.last_analysis_date = timezone.now()
+            asset.save(update_fields=['confidentiality', 'integrity', 'availability', 'risk_index', 'last_analysis_date', 'updated_at'])
             
             response_data = {
                 'asset_id': asset.id,
@@ -416,10 +646,8 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 'timestamp': asset.last_analysis_date
             }
             
-            return Response(
-                RiskIdentificationResponseSerializer(response_data).data,
-                status=status.HTTP_200_OK
-            )
+            # Fixed-shape payload of plain values; the renderer encodes the UUID and datetime
+            return Response(response_data, status=status.HTTP_200_OK)
             
         except Exception as e:
             return Response(
@@ -428,6 +656,7 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             )
 
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def identify_risk_enhanced(self, request, pk=None):
         """
         Enhanced Risk Identification using multiple standardized methodologies
@@ -448,7 +677,8 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             availability = float(request.data.get('availability', 0.5))
             
             # Validate CIA scores
-            if not all(0.0 <= score <= 1.0 for score in [confidentiality, integrity, availability]):
+            cia_scores = {'confidentiality': confidentiality, 'integrity': integrity, 'availability': availability}
+            if _first_outside_unit_range(cia_scores) is not None:
                 return Response({
                     'error': 'CIA scores must be between 0.0 and 1.0'
                 }, status=status.HTTP_400_BAD_REQUEST)
@@ -472,17 +702,9 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             # Perform comprehensive risk identification
             risk_identifier = IntegratedRiskIdentification()
             
-            # Map methodology names to enums
-            methodology_mapping = {
-                'iso_27005': RiskMethodology.ISO_27005,
-                'nist_sp_800_30': RiskMethodology.NIST_SP_800_30,
-                'octave': RiskMethodology.OCTAVE,
-                'integrated': RiskMethodology.INTEGRATED
-            }
-            
             methodologies_to_use = [
-                methodology_mapping[m] for m in include_methodologies 
-                if m in methodology_mapping
+                _METHODOLOGIES_BY_NAME[m] for m in include_methodologies 
+                if m in _METHODOLOGIES_BY_NAME
             ]
             
             if not methodologies_to_use:
@@ -500,15 +722,16 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 comprehensive_result.get('integrated_assessment')
             )
             
-            # Update asset with integrated results
+            # Update asset with integrated results (scores rounded for the API)
             integrated_assessment = comprehensive_result.get('integrated_assessment')
+            integrated_scores = integrated_assessment.to_api_dict() if integrated_assessment else {}
             if integrated_assessment:
                 asset.confidentiality = confidentiality
                 asset.integrity = integrity
                 asset.availability = availability
-                asset.risk_index = integrated_assessment.risk_score
+                asset.risk_index = integrated_scores['risk_score']
                 asset.risk_identification_performed_date = timezone.now()
-                asset.save()
+                asset.save(update_fields=['confidentiality', 'integrity', 'availability', 'risk_index', 'updated_at'])
             
             # Prepare response
             response_data = {
@@ -518,10 +741,10 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 'assessment_timestamp': comprehensive_result.get('assessment_timestamp'),
                 'integrated_assessment': {
                     'methodology': integrated_assessment.methodology.value if integrated_assessment else 'unknown',
-                    'risk_score': integrated_assessment.risk_score if integrated_assessment else 0.0,
+                    'risk_score': integrated_scores.get('risk_score', 0.0),
                     'risk_level': integrated_assessment.risk_level if integrated_assessment else 'Unknown',
-                    'likelihood': integrated_assessment.likelihood if integrated_assessment else 0.0,
-                    'impact': integrated_assessment.impact if integrated_assessment else 0.0,
+                    'likelihood': integrated_scores.get('likelihood', 0.0),
+                    'impact': integrated_scores.get('impact', 0.0),
                     'threats_count': len(integrated_assessment.threats_identified) if integrated_assessment else 0,
                     'vulnerabilities_count': len(integrated_assessment.vulnerabilities_identified) if integrated_assessment else 0,
                     'compliance_frameworks': integrated_assessment.compliance_frameworks if integrated_assessment else []
@@ -544,7 +767,7 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             for method_name, result in comprehensive_result.get('individual_assessments', {}).items():
                 response_data['individual_assessments'][method_name] = {
                     'methodology': result.methodology.value,
-                    'risk_score': result.risk_score,
+                    'risk_score': round(result.risk_score, 3),
                     'risk_level': result.risk_level,
                     'threats_identified': len(result.threats_identified),
                     'vulnerabilities_identified': len(result.vulnerabilities_identified),
@@ -559,93 +782,16 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 'details': 'Please check your input data and try again'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    def _get_next_steps_for_risk_level(self, risk_level: str) -> List[str]:
+    def _get_next_steps_for_risk_level(self, risk_level: str) -> Tuple[str, ...]:
         """Get recommended next steps based on risk level"""
-        next_steps_map = {
-            'Very High': [
-                'Proceed immediately to Risk Analysis phase',
-                'Consider implementing emergency controls',
-                'Escalate to executive management',
-                'Document risk treatment decisions'
-            ],
-            'High': [
-                'Proceed to Risk Analysis phase within 24-48 hours',
-                'Review and prioritize security controls',
-                'Engage risk management team',
-                'Prepare risk treatment plan'
-            ],
-            'Moderate': [
-                'Schedule Risk Analysis phase within 1 week',
-                'Review existing security controls',
-                'Consider risk mitigation options',
-                'Update risk register'
-            ],
-            'Low': [
-                'Proceed with routine Risk Analysis phase',
-                'Maintain current security posture',
-                'Schedule periodic risk review',
-                'Document findings'
-            ],
-            'Very Low': [
-                'Complete Risk Analysis phase as planned',
-                'Continue standard monitoring',
-                'Annual risk assessment sufficient'
-            ]
-        }
-        
-        return next_steps_map.get(risk_level, next_steps_map['Moderate'])
+        return _NEXT_STEPS.get(risk_level, _MODERATE_NEXT_STEPS)
 
     @action(detail=True, methods=['get'])
     def risk_identification_methodologies(self, request, pk=None):
         """
         Get available risk identification methodologies and their details
         """
-        methodologies = {
-            'iso_27005': {
-                'name': 'ISO 27005:2022',
-                'description': 'Information security risk management standard',
-                'approaches': ['Asset-based', 'Event-based', 'Hybrid'],
-                'compliance_frameworks': ['ISO 27001', 'ISO 27005:2022'],
-                'best_for': 'Comprehensive information security risk management',
-                'implementation_status': 'Fully Implemented'
-            },
-            'nist_sp_800_30': {
-                'name': 'NIST SP 800-30 Rev 1',
-                'description': 'Guide for Conducting Risk Assessments',
-                'approaches': ['Three-tiered assessment', 'Threat source analysis'],
-                'compliance_frameworks': ['NIST Cybersecurity Framework', 'NIST SP 800-30'],
-                'best_for': 'Federal and enterprise risk assessments',
-                'implementation_status': 'Fully Implemented'
-            },
-            'octave': {
-                'name': 'OCTAVE',
-                'description': 'Operationally Critical Threat, Asset, and Vulnerability Evaluation',
-                'approaches': ['Organizational view', 'Technological view', 'Risk analysis'],
-                'compliance_frameworks': ['Asset-Centric Risk Management'],
-                'best_for': 'Operational risk assessment with business focus',
-                'implementation_status': 'Fully Implemented'
-            },
-            'integrated': {
-                'name': 'Integrated Multi-Framework Approach',
-                'description': 'Combines multiple methodologies for comprehensive assessment',
-                'approaches': ['ISO 27005', 'NIST SP 800-30', 'OCTAVE'],
-                'compliance_frameworks': ['Multiple standards compliance'],
-                'best_for': 'Comprehensive risk identification with multiple perspectives',
-                'implementation_status': 'Fully Implemented'
-            }
-        }
-        
-        return Response({
-            'available_methodologies': methodologies,
-            'default_methodology': 'integrated',
-            'recommended_combination': ['iso_27005', 'nist_sp_800_30', 'octave'],
-            'implementation_guide': {
-                'step_1': 'Select appropriate methodology based on organizational needs',
-                'step_2': 'Assess CIA triad (Confidentiality, Integrity, Availability)',
-                'step_3': 'Execute risk identification using selected methodology',
-                'step_4': 'Review results and proceed to Risk Analysis phase'
-            }
-        }, status=status.HTTP_200_OK)
+        return Response(_RISK_METHODOLOGIES_RESPONSE, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'])
     def analyze_risk(self, request, pk=None):
@@ -670,8 +816,8 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             asset.calculated_risk_level = risk_analysis['calculated_risk_level']
             asset.harm_value = risk_analysis['harm_value']
             asset.mathematical_risk_category = risk_analysis['risk_category']
-            asset.last_analysis_date = datetime.now()
-            asset.save()
+            asset.last_analysis_date = timezone.now()
+            asset.save(update_fields=['calculated_risk_level', 'harm_value', 'mathematical_risk_category', 'last_analysis_date', 'updated_at'])
             
             response_data = {
                 'asset_id': asset.id,
@@ -683,10 +829,8 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 'timestamp': asset.last_analysis_date
             }
             
-            return Response(
-                RiskAnalysisResponseSerializer(response_data).data,
-                status=status.HTTP_200_OK
-            )
+            # Fixed-shape payload of plain values; the renderer encodes the UUID and datetime
+            return Response(response_data, status=status.HTTP_200_OK)
             
         except Exception as e:
             return Response(
@@ -703,16 +847,13 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         """
         try:
             asset = self.get_object()
-            serializer = ModelComparisonRequestSerializer(data={
-                'asset_id': asset.id,
-                **request.data
-            })
+            serializer = ModelComparisonRequestSerializer(data=request.data, context={'asset': asset})
             
             if not serializer.is_valid():
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
-            # Initialize comparison framework
-            comparison_framework = ModelComparisonFramework()
+            # Shared comparison framework
+            comparison_framework = get_comparison_framework()
             
             # Perform comparison using 7-parameter approach
             comparison_result = comparison_framework.compare_all_approaches(
@@ -756,22 +897,23 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 else:
                     asset.mathematical_risk_category = "Medium Risk"  # Safe fallback
             
-            asset.comparison_performed_date = datetime.now()
-            asset.save()
-            
-            # Save detailed comparison record
-            ModelComparison.objects.create(
-                asset=asset,
-                experiment_name=serializer.validated_data.get('experiment_name', 'Standard Comparison'),
-                input_confidentiality=asset.confidentiality or 0.5,
-                input_integrity=asset.integrity or 0.5,
-                input_availability=asset.availability or 0.5,
-                input_asset_classification=asset.classification_value or 0.5,
-                fuzzy_prediction=predictions.get('enhanced_fuzzy', 'Error'),
-                svm_prediction=predictions.get('modern_svm', 'Error'),
-                dt_prediction=predictions.get('modern_dt', 'Error'),
+            asset.comparison_performed_date = timezone.now()
+            
+            # Save the asset and the detailed comparison record in one commit
+            with transaction.atomic():
+                asset.save(update_fields=_COMPARISON_UPDATE_FIELDS)
+                ModelComparison.objects.create(
+                    asset=asset,
+                    experiment_name=serializer.validated_data.get('experiment_name', 'Standard Comparison'),
+                    input_confidentiality=asset.confidentiality or 0.5,
+                    input_integrity=asset.integrity or 0.5,
+                    input_availability=asset.availability or 0.5,
+                    input_asset_classification=asset.classification_value or 0.5,
+                    fuzzy_prediction=predictions.get('enhanced_fuzzy', 'Error'),
+                    svm_prediction=predictions.get('modern_svm', 'Error'),
+                    dt_prediction=predictions.get('modern_dt', 'Error'),
 
-            )
+                )
             
             response_data = {
                 'asset_id': asset.id,
@@ -811,13 +953,19 @@ class AssetListingViewSet(viewsets.ModelViewSet):
             asset_ids = serializer.validated_data['asset_ids']
             experiment_name = serializer.validated_data.get('experiment_name', 'Batch Comparison')
             
-            # Get assets
-            assets = AssetListing.objects.filter(id__in=asset_ids)
+            # Get assets, loading only the model inputs and the fields written back,
+            # and order them as requested so results line up with asset_ids
+            asset_map = {
+                asset.id: asset
+                for asset in AssetListing.objects.filter(id__in=asset_ids).only(
+                    *_BATCH_COMPARE_INPUT_FIELDS, *_COMPARISON_UPDATE_FIELDS
+                )
+            }
+            assets = [asset_map[asset_id] for asset_id in dict.fromkeys(asset_ids) if asset_id in asset_map]
             
-            # Prepare test data with 7 parameters
-            test_data = []
-            for asset in assets:
-                test_data.append((
+            # Prepare test data as an (N, 7) feature matrix
+            test_data = np.array([
+                (
                     asset.business_criticality or 0.5,
                     asset.data_sensitivity or 0.5,
                     asset.operational_dependency or 0.5,
@@ -825,15 +973,20 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                     asset.confidentiality or 0.5,
                     asset.integrity or 0.5,
                     asset.availability or 0.5
-                ))
+                )
+                for asset in assets
+            ], dtype=float).reshape(len(assets), 7)
             
-            # Initialize comparison framework
-            comparison_framework = ModelComparisonFramework()
+            # Shared comparison framework
+            comparison_framework = get_comparison_framework()
             
             # Perform batch comparison
             batch_results = comparison_framework.batch_comparison(test_data)
             
-            # Update assets with results
+            # Update assets with results, collected for one bulk write
+            comparison_date = timezone.now()
+            updated_assets = []
+            comparison_records = []
             for i, asset in enumerate(assets):
                 individual_result = batch_results['individual_results'][i]
                 if 'predictions' in individual_result:
@@ -865,11 +1018,12 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                         else:
                             asset.mathematical_risk_category = "Medium Risk"  # Safe fallback
                     
-                    asset.comparison_performed_date = datetime.now()
-                    asset.save()
+                    asset.comparison_performed_date = comparison_date
+                    asset.updated_at = comparison_date
+                    updated_assets.append(asset)
                     
-                    # Save detailed comparison record
-                    ModelComparison.objects.create(
+                    # Detailed comparison record
+                    comparison_records.append(ModelComparison(
                         asset=asset,
                         experiment_name=experiment_name,
                         input_confidentiality=asset.confidentiality,
@@ -880,12 +1034,16 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                         svm_prediction=predictions.get('modern_svm', 'Error'),
                         dt_prediction=predictions.get('modern_dt', 'Error'),
 
-                    )
+                    ))
+            
+            with transaction.atomic():
+                AssetListing.objects.bulk_update(updated_assets, _COMPARISON_UPDATE_FIELDS, batch_size=500)
+                ModelComparison.objects.bulk_create(comparison_records, batch_size=500)
             
             # Prepare response
             response_data = {
                 'batch_size': len(asset_ids),
-                'timestamp': datetime.now(),
+                'timestamp': comparison_date,
                 'performance_metrics': batch_results.get('performance_metrics', {}),
                 'individual_results': batch_results['individual_results'],
                 'summary': {
@@ -914,6 +1072,13 @@ class AssetListingViewSet(viewsets.ModelViewSet):
         GET /api/assets/performance_metrics/
         """
         try:
+            # Latest performance changes only when a comparison row is saved.
+            # Writes from other processes can stay invisible for up to
+            # PERFORMANCE_METRICS_CACHE_TIMEOUT seconds (per-process cache).
+            response_data = cache.get(PERFORMANCE_METRICS_CACHE_KEY)
+            if response_data is not None:
+                return Response(response_data)
+            
             # Get latest performance comparison
             latest_performance = ModelPerformanceComparison.objects.order_by('-test_date').first()
             
@@ -947,14 +1112,17 @@ class AssetListingViewSet(viewsets.ModelViewSet):
                 }
             ]
             
-            return Response({
+            response_data = {
                 'experiment_name': latest_performance.experiment_name,
                 'test_date': latest_performance.test_date,
                 'total_test_cases': latest_performance.total_test_cases,
                 'best_performing_model': latest_performance.best_performing_model,
                 'statistical_significance_p_value': latest_performance.statistical_significance_p_value,
-                'performance_metrics': PerformanceMetricsSerializer(performance_data, many=True).data
-            })
+                'performance_metrics': list(PerformanceMetricsSerializer(performance_data, many=True).data)
+            }
+            cache.set(PERFORMANCE_METRICS_CACHE_KEY, response_data, PERFORMANCE_METRICS_CACHE_TIMEOUT)
+            
+            return Response(response_data)
             
         except Exception as e:
             return Response(
@@ -1010,7 +1178,14 @@ class ModelComparisonViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing model comparisons
     """
-    queryset = ModelComparison.objects.all().select_related('asset')
+    # Only the serialized columns, and just the name from the joined asset row
+    queryset = ModelComparison.objects.all().select_related('asset').only(
+        'id', 'asset', 'asset__asset', 'experiment_name',
+        'input_confidentiality', 'input_integrity', 'input_availability', 'input_asset_classification',
+        'fuzzy_prediction', 'svm_prediction', 'dt_prediction',
+        'expert_label', 'standards_compliant', 'comparison_date', 'comparison_version',
+        'created_at', 'updated_at'
+    )
     serializer_class = ModelComparisonSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['experiment_name', 'asset', 'fuzzy_prediction', 'svm_prediction', 'dt_prediction']